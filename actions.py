@@ -0,0 +1,9 @@
+class Action:
+    """Input actions the game responds to, whether they come from the keyboard, a bot or a replay."""
+
+    MOVE_RIGHT = 1
+    STOP_RIGHT = 2
+    MOVE_LEFT = 3
+    STOP_LEFT = 4
+    FIRE = 5
+    PLAY = 6
@@ -1,134 +1,334 @@
+import argparse
+import os
 import sys
-from time import sleep
 import pygame
 from settings import Settings
+from assets import AssetManager
+from timestep import FixedTimestep
+from renderer import Renderer
+from text_cache import TextCache
+from game_state import GameState
+from actions import Action
+from controls import Controls
+from recording import InputRecorder
+from snapshot import Snapshot, capture, restore
+from profiles import ProfileWatcher, RESTART_ONLY, add_profile_argument, find_profile, load_settings
+from profiler import Profiler, ProfilerOverlay, StartupTimer
+from high_scores import HighScoreStore
 from game_stats import GameStats
 from scoreboard import Scoreboard
 from button import Button
 from ship import Ship
-from bullet import Bullet
-from alien import Alien
+from bullets import Bullets
+from fleet import Fleet
+from fleet_layouts import FleetLayouts
+from collision import CollisionEngine
 
 
 class AlienInvasion:
     """Overall class to manage game assets and behavior."""
 
-    def __init__(self):
-        """Initialize the game, and create game resources."""
-        pygame.init()
-        self.settings = Settings()
+    def __init__(self, settings=None, headless=False):
+        """Initialize the game, and create game resources.
+
+        A headless game renders to SDL's dummy video driver instead of a window,
+        and skips the respawn and level pauses so it can be simulated as fast as possible.
+        """
+        self.startup = StartupTimer()   # times each phase from here to the first frame
+        self.report_startup = False     # print the startup times after the first frame
+
+        self.headless = headless
+        with self.startup.phase('pygame init'):
+            if headless:
+                os.environ['SDL_VIDEODRIVER'] = 'dummy'    # must be set before the display is initialized
+            # Start only what the game uses; pygame.init() would also start audio and joysticks.
+            pygame.display.init()
+            pygame.font.init()
+        self.settings = settings or Settings()
+
+        with self.startup.phase('display'):
+            sprite_scale = self.settings.sprite_scale or 1.0
+            if self.settings.fullscreen and not headless:
+                self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)    # figure out the full window size
+                self.settings.screen_width = self.screen.get_rect().width   # update screen width to full screen
+                self.settings.screen_height = self.screen.get_rect().height  # update screen height to full screen
+                # Keep sprites in proportion to the monitor unless a scale is set
+                sprite_scale = self.settings.sprite_scale or AssetManager.scale_for(self.settings.screen_height)
+            else:
+                self.screen = pygame.display.set_mode(
+                    (self.settings.screen_width, self.settings.screen_height))    # smaller window
+            pygame.display.set_caption("Alien Invasion")
+
+        with self.startup.phase('images'):
+            # Load, scale and convert each image once, so new fleets and respawns don't touch the disk.
+            # The first frame draws every image there is, so none of them can wait.
+            self.assets = AssetManager(sprite_scale)
+            self.assets.preload()
+
+        with self.startup.phase('fonts'):
+            # Rendered text and the one shared font are reused by the scoreboard and buttons
+            self.text_cache = TextCache()
+            self.text_cache.font(48)
+
+        with self.startup.phase('high scores'):
+            # Leaderboard read after the first frame; saved by a background thread. Headless games don't keep scores.
+            self.high_scores = HighScoreStore(None if headless else self.settings.high_score_file,
+                                              self.settings.leaderboard_size)
+
+        with self.startup.phase('game objects'):
+            # Create an instance to store game statistics and create a scoreboard
+            self.stats = GameStats(self)
+            self.scoreboard = Scoreboard(self)
+
+            # Playing, respawning, level transition or game over; timed pauses never block the loop
+            self.state = GameState(self.settings.tick_rate, skip_delays=headless)
+
+            self.ship = Ship(self)  # ship instance
+            self.bullets = Bullets(self)    # all bullet positions, stored as arrays
+            self.aliens = Fleet(self)   # all alien positions, stored as arrays
+            self.fleet_layouts = FleetLayouts()     # formations, computed once per screen and sprite size
+            self.collisions = CollisionEngine(self)     # grid-based collision checks against the fleet
 
-        # self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)    # figure out the full window size
-        # self.settings.screen_width = self.screen.get_rect().width   # update screen width to full screen
-        # self.settings.screen_height = self.screen.get_rect().height  # update screen height to full screen
-        self.screen = pygame.display.set_mode(
-            (self.settings.screen_width, self.settings.screen_height))    # smaller window
-        pygame.display.set_caption("Alien Invasion")
-
-        # Create an instance to store game statistics and create a scoreboard
-        self.stats = GameStats(self)
-        self.scoreboard = Scoreboard(self)
-
-        self.ship = Ship(self)  # ship instance
-        self.bullets = pygame.sprite.Group()    # store bullets; sprite.group behaves like a list
-        self.aliens = pygame.sprite.Group()
-
-        self._create_fleet()
+            self._create_fleet()
 
-        # Make the play button, an instance of Play button
-        self.play_button = Button(self, "Play")
+            # Make the play button, an instance of Play button
+            self.play_button = Button(self, "Play")
+
+        with self.startup.phase('main loop'):
+            # Fixed simulation ticks keep gameplay independent of how fast the host renders
+            self.timestep = FixedTimestep(self.settings.tick_rate, self.settings.max_fps,
+                                          self.settings.max_ticks_per_frame)
+
+            # Draws each frame, pushing only changed regions unless settings.full_redraw is set
+            self.renderer = Renderer(self)
+
+            # Timing scopes around each phase of the loop; F3 shows them, F4 saves a trace
+            self.profiler = Profiler()
+            self.profiler_overlay = ProfilerOverlay(self)
+
+            # Keyboard and mouse commands, looked up in rebindable key tables
+            self.controls = Controls({
+                'quit': self._quit,
+                'click': self._check_play_button,
+                'fire': lambda: self._handle_action(Action.FIRE),
+                'move_right': lambda: self._handle_action(Action.MOVE_RIGHT),
+                'stop_right': lambda: self._handle_action(Action.STOP_RIGHT),
+                'move_left': lambda: self._handle_action(Action.MOVE_LEFT),
+                'stop_left': lambda: self._handle_action(Action.STOP_LEFT),
+                'toggle_profiler': self.profiler_overlay.toggle,
+                'export_profile': self._export_profile,
+                'save_snapshot': self._save_snapshot,
+                'load_snapshot': self._load_snapshot,
+                'expose': self.renderer.redraw_all,
+            })
+
+        self.ticks = 0  # simulation ticks run so far; input is stamped with this
+        self.input_source = None    # anything with actions(ai_game), e.g. a bot or replay, asked every tick
+        self.input_log = None   # an InputRecorder or InputReplayer, when one is attached
+        self.profile_watcher = None     # a ProfileWatcher, when settings come from a file that may change
 
     def run_game(self):
         """Start the main loop for the game."""
+        with self.startup.phase('event filter'):
+            # Blocking every unused event type takes milliseconds, so only games that read events pay for it
+            self.controls.allow_events()
+        with self.startup.phase('first frame'):
+            self._run_frame()
+        self._finish_startup()
         while True:
-            self._check_events()
-
-            if self.stats.game_active:  # if the game is still active
+            self._run_frame()
+
+    def _run_frame(self):
+        """Read input, run the ticks real time calls for, and draw one frame."""
+        profiler = self.profiler
+        profiler.begin_frame()
+        with profiler.scope('events'):
+            self.controls.poll()
+
+        if self.profile_watcher:
+            changed = self.profile_watcher.poll()     # between ticks, never in the middle of one
+            if changed:
+                self._reload_settings(changed)
+
+        with profiler.scope('wait'):
+            ticks = self.timestep.advance()     # sleeps to cap the frame rate
+        for _ in range(ticks):    # run as many ticks as real time allows
+            self._update_game()
+
+        # Paused sprites stay where they are instead of being interpolated
+        self._update_screen(self.timestep.alpha if self.state.is_playing() else 1.0)
+        profiler.end_frame()
+
+    def _finish_startup(self):
+        """Load what the first frame didn't need, then report the startup times if asked to."""
+        with self.startup.phase('deferred loading'):
+            # The leaderboard file is only needed for the high score shown at the top of the screen.
+            self.high_scores.load()
+            if self.high_scores.best() > self.stats.high_score:
+                self.stats.high_score = self.high_scores.best()
+                self.scoreboard.prep_high_score()
+        if self.report_startup:
+            print(self.startup.report())
+
+    def _update_game(self):
+        """Advance the simulation by one fixed tick."""
+        if self.input_source:
+            for action in self.input_source.actions(self):
+                self._handle_action(action)
+        if self.input_log:
+            self.input_log.on_tick(self)    # record or check a checkpoint
+        self.ticks += 1
+        self.state.advance()    # count down any respawn or level pause
+        if self.state.is_playing():  # if the game is active and not paused
+            with self.profiler.scope('ship'):
                 self.ship.update()
+            with self.profiler.scope('bullets'):
                 self._update_bullets()
+            with self.profiler.scope('aliens'):
                 self._update_aliens()   # update position of all aliens
 
-            self._update_screen()
-
-    def _check_events(self):
-        """Respond to keypresses and mouse events."""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                sys.exit()
-            elif event.type == pygame.KEYDOWN:
-                self._check_keydown_events(event)
-            elif event.type == pygame.KEYUP:
-                self._check_keyup_events(event)
-            elif event.type == pygame.MOUSEBUTTONDOWN:  # MouseButtonDown event
-                mouse_pos = pygame.mouse.get_pos()  # get cursor's x- and y-coordinates
-                self._check_play_button(mouse_pos)
+    def _reload_settings(self, values):
+        """Apply a reloaded settings profile as if the game had started with it."""
+        settings = self.settings
+        changed = [name for name, value in values.items()
+                   if name not in RESTART_ONLY and getattr(settings, name) != value]
+        deferred = [name for name in RESTART_ONLY if getattr(settings, name) != values[name]]
+        for name in changed:
+            setattr(settings, name, values[name])
+
+        # Re-derive the speeds and points for the current level from the new starting values and scales.
+        fleet_direction = settings.fleet_direction
+        settings.initialize_dynamic_settings()
+        for _ in range(self.stats.level - 1):
+            settings.increase_speed()
+        settings.fleet_direction = fleet_direction  # the fleet keeps heading the same way
+
+        # Objects that copied a setting when they were created
+        self.timestep.max_fps = settings.max_fps
+        self.timestep.max_ticks_per_frame = settings.max_ticks_per_frame
+        if 'bg_color' in changed:
+            self.renderer.set_background(settings.bg_color)
+            self.scoreboard.prep_score()
+            self.scoreboard.prep_high_score()
+            self.scoreboard.prep_level()
+        if 'full_redraw' in changed:
+            self.renderer.set_full_redraw(settings.full_redraw)
+
+        print(f"settings reloaded: {', '.join(changed) or 'nothing changed'}"
+              + (f"; {', '.join(deferred)} will change on restart" if deferred else ''), file=sys.stderr)
 
     def _check_play_button(self, mouse_pos):
         """Start a new game when the player clicks Play."""
         button_clicked = self.play_button.rect.collidepoint(mouse_pos)   # check if button is clicked
         if button_clicked and not self.stats.game_active:   # game started when it's inactive
-            # Reset the game settings.
-            self.settings.initialize_dynamic_settings()
-
-            # Reset the game statistics
-            self.stats.reset_stats()
-            self.stats.game_active = True
-            self.scoreboard.prep_score()    # reset score to 0
-            self.scoreboard.prep_level()    # update level
-            self.scoreboard.prep_ships()    # how many ships player have to start with
+            self._handle_action(Action.PLAY)
 
-            # Get rid of any remaining aliens and bullets
-            self.aliens.empty()
-            self.bullets.empty()
+    def _handle_action(self, action):
+        """Apply one input action, recording it first if a recorder is attached."""
+        if self.input_log:
+            self.input_log.record(self.ticks, action)
 
-            # Create a new fleet and center the ship.
-            self._create_fleet()
-            self.ship.center_ship()
-
-            # Hide the mouse cursor when the game is active
-            pygame.mouse.set_visible(False)
-
-    def _check_keydown_events(self, event):
-        """Respond to keypresses."""
-        if event.key == pygame.K_RIGHT:
-            # move the ship to the right.
+        if action == Action.MOVE_RIGHT:
             self.ship.moving_right = True
-        elif event.key == pygame.K_LEFT:
-            self.ship.moving_left = True
-        elif event.key == pygame.K_q:  # press Q to exit the game
-            sys.exit()
-        elif event.key == pygame.K_SPACE:
-            self._fire_bullet()
-
-    def _check_keyup_events(self, event):
-        """Respond to keypresses."""
-        if event.key == pygame.K_RIGHT:  # release the right arrow key
+        elif action == Action.STOP_RIGHT:
             self.ship.moving_right = False
-        elif event.key == pygame.K_LEFT:
+        elif action == Action.MOVE_LEFT:
+            self.ship.moving_left = True
+        elif action == Action.STOP_LEFT:
             self.ship.moving_left = False
+        elif action == Action.FIRE:
+            self._fire_bullet()
+        elif action == Action.PLAY and not self.stats.game_active:
+            self._start_game()
+
+    def _start_game(self):
+        """Reset settings, statistics and sprites, and start a new game."""
+        # Reset the game settings.
+        self.settings.initialize_dynamic_settings()
+
+        # Reset the game statistics
+        self.stats.reset_stats()
+        self.stats.game_active = True
+        self.state.enter(GameState.PLAYING)
+        self.scoreboard.prep_score()    # reset score to 0
+        self.scoreboard.prep_level()    # update level
+        self.scoreboard.prep_ships()    # how many ships player have to start with
+
+        # Get rid of any remaining aliens and bullets
+        self.aliens.empty()
+        self.bullets.empty()
+
+        # Create a new fleet and center the ship.
+        self._create_fleet()
+        self.ship.center_ship()
+
+        # Hide the mouse cursor when the game is active
+        pygame.mouse.set_visible(False)
+
+    def _export_profile(self):
+        """Save the recent frame timings."""
+        path = self.settings.profile_trace_file
+        try:
+            self.profiler.export_json(path + '.json')
+            self.profiler.export_csv(path + '.csv')
+        except OSError as error:
+            print(f"profile not saved: {error}", file=sys.stderr)
+
+    def _save_snapshot(self):
+        """Save the whole game state to the quicksave file."""
+        try:
+            capture(self).save(self.settings.snapshot_file)
+        except OSError as error:
+            print(f"snapshot not saved: {error}", file=sys.stderr)
+
+    def _load_snapshot(self):
+        """Put the game back in the state saved in the quicksave file."""
+        if isinstance(self.input_log, InputRecorder):
+            print("snapshot not loaded: a recording can't be replayed across a load", file=sys.stderr)
+            return
+        try:
+            restore(self, Snapshot.load(self.settings.snapshot_file))
+        except (OSError, ValueError) as error:
+            print(f"snapshot not loaded: {error}", file=sys.stderr)
+            return
+        # Steer by the keys held now, not the ones held when the snapshot was taken
+        self.ship.moving_left = self.ship.moving_right = False
+        self.controls.release_all()
+
+    def _quit(self):
+        """Finish any recording, save the leaderboard, and exit."""
+        self._shut_down()
+        sys.exit()
+
+    def _shut_down(self):
+        """Finish any recording and save the leaderboard; safe to call more than once."""
+        if self.input_log:
+            self.input_log.close(self)
+            self.input_log = None
+        if self.stats.game_active:
+            self.high_scores.submit(self.stats.score, self.stats.level)    # keep a game quit midway
+            self.stats.game_active = False
+        self.high_scores.close()
 
     def _fire_bullet(self):
-        """Create a new bullet and add it to the bullets group"""
+        """Fire a new bullet if the limit allows it"""
+        if not self.state.is_playing():     # no shooting while paused or between games
+            return
         if len(self.bullets) < self.settings.bullets_allowed:   # check how many bullets exist (length < 3)
-            new_bullet = Bullet(self)
-            self.bullets.add(new_bullet)    # add new_bullet instance in to the group
+            self.bullets.fire()     # takes a free slot in the bullet arrays
 
     def _update_bullets(self):
         """Update position of bullets and get rid of old bullets"""
-        # update bullet positions
-        self.bullets.update()  # update each sprite in the group
-
-        # Get rid of bullets that have disappeared (top of the screen)
-        for bullet in self.bullets.copy():
-            if bullet.rect.bottom <= 0:  # check if bullet disappeared off the top of the screen
-                self.bullets.remove(bullet)  # remove it if it's disappeared from the top of the screen
+        # update bullet positions and get rid of bullets that have disappeared off the top of the screen
+        self.bullets.update()
         # print(len(self.bullets))      # total number of bullets on the screen
-        self._check_bullet_alien_collisions()
+        with self.profiler.scope('collisions'):
+            self._check_bullet_alien_collisions()
 
     def _check_bullet_alien_collisions(self):
         """Respond to bullet-alien collisions."""
         # check for any bullets that have hit aliens. If so, get rid of the bullet and the alien.
-        collisions = pygame.sprite.groupcollide(self.bullets, self.aliens, True, True)
+        collisions = self.collisions.groupcollide(self.bullets)
 
         if collisions:  # if a bullet hits an alien
             for aliens in collisions.values():  # award points for each alien hit
@@ -137,14 +337,14 @@ class AlienInvasion:
             self.scoreboard.check_high_score()  # check current high score
 
         if not self.aliens:     # check whether the aliens group is empty
-            # Destroy existing bullets and create a new fleet.
+            # Destroy existing bullets, and bring in a new fleet after a short pause.
             self.bullets.empty()    # remove any existing bullets
-            self._create_fleet()    # New set of aliens
             self.settings.increase_speed()   # level up the speed
 
             # Increase level.
             self.stats.level += 1   # increase the level
             self.scoreboard.prep_level()    # display new level
+            self.state.enter(GameState.LEVEL_TRANSITION, self.settings.level_pause, self._create_fleet)
 
     def _update_aliens(self):
         """Check if the fleet is at an edge, then update the positions of all aliens in the fleet."""
@@ -152,12 +352,11 @@ class AlienInvasion:
         self.aliens.update()
 
         # Look for alien-ship collisions.
-        if pygame.sprite.spritecollideany(self.ship, self.aliens):
-            # spritecollideany stops looping through the group when collision detected; return None if no collision
-            self._ship_hit()  # first collision
-
-        # Look for aliens hitting the bottom of the screen.
-        self._check_aliens_bottom()
+        if self.collisions.collideany(self.ship.rect):
+            self._ship_hit()
+        else:
+            # Look for aliens hitting the bottom of the screen.
+            self._check_aliens_bottom()
 
     def _ship_hit(self):
         """Respond to the ship being hit by an alien."""
@@ -166,91 +365,92 @@ class AlienInvasion:
             self.stats.ships_left -= 1
             self.scoreboard.prep_ships()
 
-            # Get rid of any remaining aliens and bullets.
-            self.aliens.empty()
-            self.bullets.empty()
-
-            # Create a new fleet and center the ship.
-            self._create_fleet()
-            self.ship.center_ship()
-
-            # Pause.
-            sleep(0.5)
+            # Pause on the hit, then start over with a new fleet.
+            self.state.enter(GameState.RESPAWNING, self.settings.respawn_pause, self._respawn)
         else:
             self.stats.game_active = False  # no ships left
+            self.state.enter(GameState.GAME_OVER)
+            self.high_scores.submit(self.stats.score, self.stats.level)
             pygame.mouse.set_visible(True)  # set mouse cursor active when the game is inactive
 
+    def _respawn(self):
+        """Clear the screen of aliens and bullets, then bring in a new fleet and ship."""
+        # Get rid of any remaining aliens and bullets.
+        self.aliens.empty()
+        self.bullets.empty()
+
+        # Create a new fleet and center the ship.
+        self._create_fleet()
+        self.ship.center_ship()
+
     def _check_aliens_bottom(self):
         """Check if any aliens have reached the bottom of the screen."""
-        screen_rect = self.screen.get_rect()
-        for alien in self.aliens.sprites():
-            if alien.rect.bottom >= screen_rect.bottom:     # if an alien reaches to the bottom of the screen
-                # Treat this the same as if the ship got hit.
-                self._ship_hit()
-                break
+        if self.aliens.check_bottom():      # if an alien reaches to the bottom of the screen
+            # Treat this the same as if the ship got hit.
+            self._ship_hit()
 
     def _create_fleet(self):
-        """Create the fleet of aliens."""
-        # Create an alien and find the number of aliens in a row.
-        # Spacing between each alien is equal to one alien width
-        alien = Alien(self)     # instance of Alien
-        alien_width, alien_height = alien.rect.size   # size: tuple with the width and height of a rect object
-        available_space_x = self.settings.screen_width - (2 * alien_width)  # Horizontal space available for aliens
-        number_alien_x = available_space_x // (2 * alien_width)     # number of aliens can fit into the space
-
-        # Determine the number of rows of aliens that fit on the screen.
-        ship_height = self.ship.rect.height
-        # available vertical space
-        available_space_y = (self.settings.screen_height - (3 * alien_height) - ship_height)
-        number_rows = available_space_y // (2 * alien_height)
-
-        # Creat the full fleet of aliens.
-        for row_number in range(number_rows):   # counts from 0 to the number of rows we want
-            # Create the first row of aliens.
-            for alien_number in range(number_alien_x):
-                self._create_alien(alien_number, row_number)
-
-    def _create_alien(self, alien_number, row_number):
-        """Create an alien and place it in the row."""
-        alien = Alien(self)     # new alien
-        alien_width, alien_height  = alien.rect.size
-        alien.x = alien_width + 2 * alien_width * alien_number  # set its x-coordinate value in the row
-        alien.rect.x = alien.x
-        alien.rect.y = alien.rect.height + 2 * alien.rect.height * row_number
-        self.aliens.add(alien)
+        """Create the fleet of aliens; large fleets appear a batch per tick."""
+        x, y = self.fleet_layouts.get(self.settings.fleet_formation,
+                                      (self.settings.screen_width, self.settings.screen_height),
+                                      (self.aliens.width, self.aliens.height), self.ship.rect.height)
+        self.aliens.spawn(x, y, self.settings.fleet_spawn_per_tick)
 
     def _check_fleet_edges(self):
         """Respond appropriately if any aliens have reached an edge."""
-        for alien in self.aliens.sprites():
-            if alien.check_edges():   # if alien is at an edge
-                self._change_fleet_direction()  # change direction
-                break
+        if self.aliens.check_edges():   # if an alien is at an edge
+            self._change_fleet_direction()  # change direction
 
     def _change_fleet_direction(self):
         """Drop the entire fleet and change the fleet's direction."""
-        for alien in self.aliens.sprites():
-            alien.rect.y += self.settings.fleet_drop_speed
+        self.aliens.drop(self.settings.fleet_drop_speed)
         self.settings.fleet_direction *= -1
 
-    def _update_screen(self):
-        """Update images on the screen, and flip to the new screen."""
-        self.screen.fill(self.settings.bg_color)
-        self.ship.blitme()
-        for bullet in self.bullets.sprites():   # bullets.sprites() returns a list of all sprites in the group bullets
-            bullet.draw_bullet()
-        self.aliens.draw(self.screen)       # draw aliens on the screen
+    def _update_screen(self, alpha=1.0):
+        """Update images on the screen, and push the changes to the display.
+
+        alpha is how far between the last two simulation ticks to draw moving sprites.
+        """
+        with self.profiler.scope('erase'):
+            self.renderer.begin_frame()     # erase last frame's sprites (or the whole screen)
+
+        with self.profiler.scope('draw'):
+            self.renderer.add(self.ship.blitme(alpha))
+            self.renderer.add(self.bullets.draw(alpha))
+            # draw aliens on the screen
+            self.renderer.add(self.aliens.draw(alpha))
+
+            # Draw the score information.
+            self.renderer.add(self.scoreboard.show_score())
 
-        # Draw the score information.
-        self.scoreboard.show_score()
+            # Draw the play button if the game is inactive.
+            if not self.stats.game_active:
+                self.renderer.add(self.play_button.draw_button())
 
-        # Draw the play button if the game is inactive.
-        if not self.stats.game_active:
-            self.play_button.draw_button()
+            if self.profiler_overlay.visible:
+                self.renderer.add(self.profiler_overlay.draw())
 
-        # Make the most recently drawn screen visible
-        pygame.display.flip()
+        # Make the most recently drawn regions visible
+        with self.profiler.scope('present'):
+            self.renderer.end_frame()
 
 
 if __name__ == '__main__':
-    ai = AlienInvasion()
-    ai.run_game()
+    parser = argparse.ArgumentParser(description="Play Alien Invasion.")
+    parser.add_argument('--record', metavar='FILE', help="record this session's input for replay.py")
+    parser.add_argument('--startup-report', action='store_true', help="print how long each startup phase took")
+    add_profile_argument(parser)
+    args = parser.parse_args()
+
+    ai = AlienInvasion(settings=load_settings(args.profile))
+    ai.report_startup = args.startup_report
+    if args.record:
+        ai.input_log = InputRecorder(args.record, ai)
+    elif args.profile:
+        # Edits to the profile apply while playing; not while recording, since a replay couldn't repeat them.
+        ai.profile_watcher = ProfileWatcher(find_profile(args.profile),
+                                            choices={'fleet_formation': ai.fleet_layouts.formations})
+    try:
+        ai.run_game()
+    finally:
+        ai._shut_down()     # still end the recording and keep the score if the game crashed
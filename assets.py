@@ -0,0 +1,73 @@
+import pygame
+
+
+class AssetManager:
+    """A class to load each game image once, ready for fast blitting, and share it between sprites."""
+
+    # Image files used by the game, keyed by asset name.
+    images = {
+        'alien': 'images/alien.bmp',
+        'ship': 'images/ship.bmp',
+    }
+    colorkey = (230, 230, 230)  # background the images were drawn on; blitted as transparent
+    base_height = 800           # screen height the images were drawn for
+
+    def __init__(self, scale=1.0):
+        """Initialize an empty cache and the hit/miss counters; images are served at scale times their size."""
+        self.scale = scale
+        self._originals = {}    # name -> image as loaded from disk
+        self._surfaces = {}     # (name, scale) -> scaled image converted for the current display
+        self._display = None    # display surface the cached images were converted for
+        self.hits = {name: 0 for name in self.images}
+        self.misses = {name: 0 for name in self.images}
+
+    @classmethod
+    def scale_for(cls, screen_height):
+        """Return the image scale that keeps sprites in proportion on a screen of this height."""
+        return screen_height / cls.base_height
+
+    def get(self, name):
+        """Return the shared surface for name at the current scale, preparing it on first use."""
+        display = pygame.display.get_surface()
+        if display is not self._display:
+            # A new display means a new pixel format; drop surfaces converted for the old one.
+            self._surfaces.clear()
+            self._display = display
+
+        key = (name, self.scale)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits[name] += 1
+            return surface
+
+        self.misses[name] += 1
+        surface = self._originals.get(name)
+        if surface is None:
+            surface = self._originals[name] = pygame.image.load(self.images[name])
+        if self.scale != 1.0:
+            # Scale once here rather than on every blit.
+            width, height = surface.get_size()
+            size = (max(1, round(width * self.scale)), max(1, round(height * self.scale)))
+            surface = pygame.transform.smoothscale(surface, size)
+        if display is not None:
+            surface = self._convert(surface)
+        self._surfaces[key] = surface
+        return surface
+
+    def _convert(self, surface):
+        """Return surface in the display's pixel format, with its background made transparent."""
+        if surface.get_flags() & pygame.SRCALPHA:
+            return surface.convert_alpha()  # keep per-pixel alpha, in the display's channel order
+        surface = surface.convert()     # match the display format so blits skip conversion
+        # Run-length encoding lets blits skip whole runs of transparent pixels.
+        surface.set_colorkey(self.colorkey, pygame.RLEACCEL)
+        return surface
+
+    def preload(self, names=None):
+        """Load the named images, or every known image, so later frames never wait on disk."""
+        for name in names or self.images:
+            self.get(name)
+
+    def report(self):
+        """Return a dict of asset name -> (hits, misses)."""
+        return {name: (self.hits[name], self.misses[name]) for name in self.images}
@@ -0,0 +1,125 @@
+import argparse
+import json
+import multiprocessing
+import statistics
+import time
+
+from settings import Settings
+from alien_invasion import AlienInvasion
+from headless import RandomPolicy, run_headless, sweep_policy
+from profiles import add_profile_argument, find_profile, read_profile
+
+
+# Each worker process keeps one headless game and reuses it while the settings stay the same.
+_worker_game = None
+_worker_overrides = None
+
+
+def _get_game(overrides):
+    """Return this worker's game, building a new one if the settings overrides changed."""
+    global _worker_game, _worker_overrides
+    if _worker_game is None or overrides != _worker_overrides:
+        settings = Settings()
+        for name, value in overrides:
+            setattr(settings, name, value)
+        settings.initialize_dynamic_settings()  # pick up overridden initial speeds and points
+        _worker_game = AlienInvasion(settings=settings, headless=True)
+        _worker_overrides = overrides
+    return _worker_game
+
+
+def play_one(task):
+    """Play one game to the end (or max_ticks) in this worker and return its result record."""
+    game_number, seed, policy_name, max_ticks, overrides = task
+    ai = _get_game(overrides)
+    ai.stats.game_active = False    # make run_headless start a fresh game
+    policy = RandomPolicy(seed) if policy_name == 'random' else sweep_policy()
+
+    start_tick = ai.ticks
+    run_headless(max_ticks, policy, ai_game=ai, restart=False)
+    return {
+        'game': game_number,
+        'seed': seed,
+        'score': ai.stats.score,
+        'level': ai.stats.level,
+        'ticks': ai.ticks - start_tick,
+        'finished': not ai.stats.game_active,   # False if max_ticks ran out first
+    }
+
+
+def run_batch(games, workers=None, seed=0, policy='random', max_ticks=50000, overrides=(), chunksize=4):
+    """Play that many headless games across a process pool, yielding each result as it arrives.
+
+    Game n uses seed + n, so a batch is reproducible whatever the worker count.
+    overrides is a tuple of (settings attribute, value) pairs applied to every game.
+    """
+    tasks = [(number, seed + number, policy, max_ticks, tuple(overrides)) for number in range(games)]
+    pool = multiprocessing.Pool(workers)
+    try:
+        yield from pool.imap_unordered(play_one, tasks, chunksize)
+    finally:
+        # Let the workers exit on their own; terminate() can hang once pygame is running in them.
+        pool.close()
+        pool.join()
+
+
+def summarize(records):
+    """Return aggregate statistics for a list of result records."""
+    scores = [record['score'] for record in records]
+    levels = [record['level'] for record in records]
+    ticks = [record['ticks'] for record in records]
+    return {
+        'games': len(records),
+        'score_mean': statistics.fmean(scores),
+        'score_median': statistics.median(scores),
+        'score_max': max(scores),
+        'level_mean': statistics.fmean(levels),
+        'level_max': max(levels),
+        'ticks_mean': statistics.fmean(ticks),
+        'unfinished': sum(not record['finished'] for record in records),
+    }
+
+
+def _parse_override(text):
+    """Turn 'name=value' into a (name, number) settings override."""
+    name, value = text.split('=', 1)
+    if not hasattr(Settings(), name):
+        raise argparse.ArgumentTypeError(f"unknown setting {name!r}")
+    return name, float(value) if '.' in value else int(value)
+
+
+def main():
+    """Run a batch from the command line, streaming records to a file and printing a summary."""
+    parser = argparse.ArgumentParser(description="Play many headless Alien Invasion games in parallel.")
+    parser.add_argument('--games', type=int, default=100)
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: one per core)")
+    parser.add_argument('--seed', type=int, default=0, help="seed of the first game")
+    parser.add_argument('--policy', choices=('random', 'sweep'), default='random')
+    parser.add_argument('--max-ticks', type=int, default=50000, help="give up on a game after this many ticks")
+    parser.add_argument('--set', type=_parse_override, action='append', default=[], metavar='NAME=VALUE',
+                        help="override a setting for every game, e.g. --set speedup_scale=1.2")
+    parser.add_argument('--out', help="write one JSON record per game to this file")
+    add_profile_argument(parser)
+    args = parser.parse_args()
+    # A profile is just a set of overrides; --set ones come after it and win.
+    overrides = (list(read_profile(find_profile(args.profile)).items()) if args.profile else []) + args.set
+
+    out = open(args.out, 'w') if args.out else None
+    records = []
+    start = time.perf_counter()
+    for record in run_batch(args.games, args.workers, args.seed, args.policy, args.max_ticks, overrides):
+        records.append(record)
+        if out:
+            out.write(json.dumps(record) + '\n')
+    elapsed = time.perf_counter() - start
+    if out:
+        out.close()
+
+    print(f"{len(records)} games in {elapsed:.2f}s ({len(records) / elapsed:.1f} games/s, "
+          f"{sum(record['ticks'] for record in records) / elapsed:,.0f} ticks/s)")
+    for name, value in summarize(records).items():
+        print(f"{name:<14}{value:>12,.1f}" if isinstance(value, float) else f"{name:<14}{value:>12,}")
+
+
+if __name__ == '__main__':
+    main()
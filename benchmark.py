@@ -0,0 +1,131 @@
+import argparse
+import gc
+import os
+import sys
+from time import perf_counter
+
+from settings import Settings
+from alien_invasion import AlienInvasion
+from headless import run_headless, sweep_policy
+from profiles import find_profile, read_profile
+from snapshot import Snapshot, restore
+
+
+# Each scenario overrides some settings and may start at a later level.
+SCENARIOS = [
+    {'name': 'baseline', 'settings': {}, 'level': 1},
+    {'name': 'large fleet', 'settings': {'screen_width': 2400, 'screen_height': 1600}, 'level': 1},
+    {'name': 'huge fleet', 'settings': {'screen_width': 4800, 'screen_height': 3200}, 'level': 1},
+    {'name': 'many bullets', 'settings': {'bullets_allowed': 200}, 'level': 1},
+    {'name': 'late level', 'settings': {}, 'level': 10},
+]
+
+# Reported subsystems and the profiler scopes that make them up.
+SUBSYSTEMS = [
+    ('ship', ('ship',)),
+    ('bullets', ('bullets',)),
+    ('collisions', ('collisions',)),
+    ('aliens', ('aliens',)),
+    ('render', ('erase', 'draw', 'present')),
+]
+
+
+def _make_game(scenario):
+    """Create a headless game set up for scenario."""
+    settings = Settings()
+    for name, value in scenario['settings'].items():
+        setattr(settings, name, value)
+    settings.initialize_dynamic_settings()  # pick up overridden initial speeds and points
+    ai = AlienInvasion(settings=settings, headless=True)
+    ai._start_game()
+    if scenario.get('snapshot'):
+        restore(ai, scenario['snapshot'])    # start right where the snapshot was taken
+        return ai
+    for _ in range(scenario['level'] - 1):
+        ai.settings.increase_speed()
+    ai.stats.level = scenario['level']
+    return ai
+
+
+def run_scenario(scenario, ticks, render=False):
+    """Benchmark one scenario and return a dict of results."""
+    # First pass: throughput, with no memory measurements in the way.
+    ai = _make_game(scenario)
+    fleet_size = len(ai.aliens)
+    start = perf_counter()
+    run_headless(ticks, sweep_policy(), render=render, ai_game=ai)
+    elapsed = perf_counter() - start
+
+    # Second pass: time per subsystem from the game's profiler, and memory behavior.
+    ai = _make_game(scenario)
+    ai.profiler.reset()
+    collections_before = gc.get_stats()[0]['collections']
+    blocks_before = sys.getallocatedblocks()
+    run_headless(ticks, sweep_policy(), render=render, ai_game=ai)
+    blocks_after = sys.getallocatedblocks()
+    collections_after = gc.get_stats()[0]['collections']
+
+    totals = ai.profiler.totals
+    timings = {label: sum(totals.get(scope, 0.0) for scope in scopes) for label, scopes in SUBSYSTEMS}
+    return {
+        'name': scenario['name'],
+        'fleet': fleet_size,
+        'ticks_per_sec': ticks / elapsed,
+        'us_per_tick': {label: total / ticks * 1e6 for label, total in timings.items()},
+        # Net change in allocated blocks, not allocations: memory freed during the run cancels out,
+        # so this can be negative, and a steady climb means the loop is holding on to objects.
+        'net_blocks_per_tick': (blocks_after - blocks_before) / ticks,
+        'gc_per_1k_ticks': (collections_after - collections_before) * 1000 / ticks,
+        # Broadphase quality: exact tests run per tick, and how many of them were real hits
+        'pairs_per_tick': ai.collisions.candidate_pairs / ticks,
+        'hit_ratio': ai.collisions.hit_ratio(),
+    }
+
+
+def print_results(results):
+    """Print benchmark results as a table."""
+    labels = [label for label, _ in SUBSYSTEMS]
+    header = f"{'scenario':<14}{'fleet':>6}{'ticks/s':>10}" + ''.join(f"{label:>12}" for label in labels)
+    print(header + f"{'net blk/t':>11}{'gc/1k':>8}{'pairs/t':>9}{'hits':>7}")
+    print('-' * (len(header) + 35))
+    for result in results:
+        row = f"{result['name']:<14}{result['fleet']:>6}{result['ticks_per_sec']:>10,.0f}"
+        row += ''.join(f"{result['us_per_tick'][label]:>10.1f}us" for label in labels)
+        row += f"{result['net_blocks_per_tick']:>11.2f}{result['gc_per_1k_ticks']:>8.1f}"
+        row += f"{result['pairs_per_tick']:>9.2f}{result['hit_ratio']:>7.1%}"
+        print(row)
+
+
+def _label(path):
+    """Return a scenario name for a profile or snapshot file: its name without directory or extension."""
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def main():
+    """Run the benchmark scenarios from the command line."""
+    parser = argparse.ArgumentParser(description="Benchmark the Alien Invasion update loop.")
+    parser.add_argument('--ticks', type=int, default=3000, help="simulation ticks per scenario")
+    parser.add_argument('--scenario', action='append', help="only run the named scenario(s)")
+    parser.add_argument('--render', action='store_true', help="include drawing in the measurement")
+    parser.add_argument('--profile', action='append', default=[], metavar='NAME',
+                        help="also run a scenario with the settings of this profile (file or name)")
+    parser.add_argument('--snapshot', action='append', default=[], metavar='FILE',
+                        help="also run a scenario that starts from this saved game state")
+    args = parser.parse_args()
+
+    scenarios = [scenario for scenario in SCENARIOS
+                 if not args.scenario or scenario['name'] in args.scenario]
+    for name in args.profile:
+        scenarios.append({'name': _label(name), 'settings': read_profile(find_profile(name)), 'level': 1})
+    for path in args.snapshot:
+        snapshot = Snapshot.load(path)
+        width, height = snapshot.values['screen_size']
+        scenarios.append({'name': _label(path),
+                          'settings': {'screen_width': width, 'screen_height': height,
+                                       'sprite_scale': snapshot.values.get('sprite_scale', 1.0)},
+                          'level': snapshot.values['level'], 'snapshot': snapshot})
+    print_results([run_scenario(scenario, args.ticks, args.render) for scenario in scenarios])
+
+
+if __name__ == '__main__':
+    main()
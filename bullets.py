@@ -0,0 +1,141 @@
+import gc
+
+import numpy as np
+import pygame
+
+from collision import rect_round
+
+
+class Bullets:
+    """A class to manage every bullet fired from the ship in one set of arrays."""
+
+    def __init__(self, ai_game, capacity=16):
+        """Initialize empty bullet storage with room for capacity bullets."""
+        self.screen = ai_game.screen
+        self.settings = ai_game.settings
+        self.ship = ai_game.ship
+
+        # One slot per bullet, oldest first: left edge, exact top, and top at the previous tick.
+        self.x = np.empty(capacity, dtype=np.int64)
+        self.y = np.empty(capacity, dtype=np.float64)
+        self.prev_y = np.empty(capacity, dtype=np.float64)
+        self.count = 0      # slots in use; the rest are spare and get reused
+        self.grows = 0      # times the storage had to be enlarged
+        self.fired = 0      # bullets put in a slot so far
+        self.reused = 0     # of those, how many went into a slot an earlier bullet had used
+        self._high_water = 0    # slots ever used
+        self._gc_start = self._gc_collections()
+
+        self._image = None  # one bullet-sized surface, blitted for every bullet
+        self._image_key = None
+
+    def __len__(self):
+        """Return the number of bullets in flight."""
+        return self.count
+
+    def empty(self):
+        """Remove every bullet."""
+        self.count = 0
+
+    def restore(self, x, y, prev_y):
+        """Replace every bullet with saved ones, given oldest first."""
+        count = len(x)
+        while count > len(self.x):
+            self._grow()
+        self.x[:count] = x
+        self.y[:count] = y
+        self.prev_y[:count] = prev_y
+        self.count = count
+        self._high_water = max(self._high_water, count)
+
+    def fire(self):
+        """Add a bullet at the ship's current position."""
+        if self.count == len(self.x):
+            self._grow()
+        rect = pygame.Rect(0, 0, self.settings.bullet_width, self.settings.bullet_height)
+        rect.midtop = self.ship.rect.midtop     # match ship's midtop attribute
+        self.x[self.count] = rect.x
+        self.y[self.count] = self.prev_y[self.count] = rect.y
+        self.count += 1
+        self.fired += 1
+        if self.count <= self._high_water:
+            self.reused += 1
+        else:
+            self._high_water = self.count
+
+    def update(self):
+        """Move every bullet up the screen and drop the ones that have left it."""
+        count = self.count
+        self.prev_y[:count] = self.y[:count]
+        self.y[:count] -= self.settings.bullet_speed    # fired the bullet upward
+
+        # A bullet is gone once its bottom reaches the top of the screen.
+        on_screen = self.rect_y() + self.settings.bullet_height > 0
+        if not on_screen.all():
+            self._keep(on_screen)
+
+    def rect_y(self):
+        """Return the bullets' tops rounded to pixels, like pygame.Rect does."""
+        return rect_round(self.y[:self.count])
+
+    def rects(self, indices=None):
+        """Return a list of the bullets' Rects, oldest first, or only those at indices."""
+        width, height = self.settings.bullet_width, self.settings.bullet_height
+        x, y = self.x[:self.count], self.rect_y()
+        if indices is not None:
+            x, y = x[indices], y[indices]
+        return [pygame.Rect(left, top, width, height) for left, top in zip(x.tolist(), y.tolist())]
+
+    def remove(self, indices):
+        """Remove the bullets at indices."""
+        keep = np.ones(self.count, dtype=bool)
+        keep[indices] = False
+        self._keep(keep)
+
+    def draw(self, alpha=1.0):
+        """Draw every bullet between its last two positions in one blits call; return the drawn Rects."""
+        count = self.count
+        y = rect_round(self.prev_y[:count] + (self.y[:count] - self.prev_y[:count]) * alpha)
+        image = self._bullet_image()
+        return self.screen.blits([(image, position) for position in zip(self.x[:count].tolist(), y.tolist())])
+
+    def reuse_rate(self):
+        """Return the fraction of fired bullets that reused a slot."""
+        return self.reused / self.fired if self.fired else 0.0
+
+    def report(self):
+        """Return the slot counters, plus garbage collections since the storage was made."""
+        return {'capacity': len(self.x), 'in_use': self.count, 'reused': self.reused,
+                'reuse_rate': self.reuse_rate(), 'grows': self.grows,
+                'gc_collections': self._gc_collections() - self._gc_start}
+
+    def _keep(self, keep):
+        """Pack the bullets where keep is True to the front of the arrays, in order."""
+        count = int(np.count_nonzero(keep))
+        for array in (self.x, self.y, self.prev_y):
+            array[:count] = array[:self.count][keep]
+        self.count = count
+
+    def _grow(self):
+        """Double the storage, keeping the bullets in flight."""
+        capacity = 2 * len(self.x)
+        for name in ('x', 'y', 'prev_y'):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+        self.grows += 1
+
+    def _bullet_image(self):
+        """Return a solid bullet surface, rebuilding it if the bullet settings changed."""
+        key = (self.settings.bullet_width, self.settings.bullet_height, self.settings.bullet_color)
+        if key != self._image_key:
+            self._image = pygame.Surface(key[:2]).convert(self.screen)
+            self._image.fill(self.settings.bullet_color)
+            self._image_key = key
+        return self._image
+
+    @staticmethod
+    def _gc_collections():
+        """Return the number of garbage collections run so far, across generations."""
+        return sum(generation['collections'] for generation in gc.get_stats())
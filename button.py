@@ -6,12 +6,13 @@ class Button:
         """Initialize button attributes."""
         self.screen = ai_game.screen
         self.screen_rect = self.screen.get_rect()
+        self.text_cache = ai_game.text_cache
 
         # Set the dimensions and properties of the button.
         self.width, self.height = 200, 50
         self.button_color = (0, 255, 0)         # green
         self.text_color = (255, 255, 255)       # white
-        self.font = pygame.font.SysFont(None, 48)   # None: default font; 48: size of the text
+        self.font = self.text_cache.font(48)    # the default font at size 48, shared with the scoreboard
 
         # Build the button's rect object and center it.
         self.rect = pygame.Rect(0, 0, self.width, self.height)
@@ -22,12 +23,14 @@ class Button:
 
     def _prep_msg(self, msg):
         """Turn msg into a rendered image and center text on the button."""
-        # font.render(msg, True): True: antialiasing on, makes the edges of the text smoother
-        self.msg_image = self.font.render(msg, True, self.text_color, self.button_color)    # turn text to image
+        # rendered with antialiasing on, which makes the edges of the text smoother
+        self.msg_image = self.text_cache.render(self.font, msg, self.text_color, self.button_color)  # text to image
         self.msg_image_rect = self.msg_image.get_rect()
         self.msg_image_rect.center = self.rect.center   # center the text image on the button
 
     def draw_button(self):
+        """Draw the button and return the Rect it covers."""
         # Draw blank button and then draw message.
         self.screen.fill(self.button_color, self.rect)    # draw the rectangular portion of the button
-        self.screen.blit(self.msg_image, self.msg_image_rect)   # draw the text image to the screen
\ No newline at end of file
+        self.screen.blit(self.msg_image, self.msg_image_rect)   # draw the text image to the screen
+        return self.rect
@@ -0,0 +1,118 @@
+import numpy as np
+
+
+def rect_round(values):
+    """Return an array of values rounded to whole pixels the way assigning to a pygame.Rect does.
+
+    pygame rounds halves away from zero (2.5 -> 3), where np.rint rounds them to even (2.5 -> 2).
+    """
+    values = np.asarray(values, dtype=np.float64)
+    whole = np.trunc(values)
+    return np.where(np.abs(values - whole) == 0.5, whole + np.sign(values), np.rint(values)).astype(np.int64)
+
+
+class SpatialHash:
+    """A uniform grid that buckets rectangles by the cells they overlap."""
+
+    def __init__(self, cell_size):
+        """Initialize an empty grid with square cells of cell_size pixels."""
+        self.cell_size = cell_size
+        self.cells = {}     # (column, row) -> set of keys in that cell
+        self.bounds = {}    # key -> (first column, first row, last column, last row)
+
+    def cell_bounds(self, left, top, width, height):
+        """Return the range of cells covered by a rectangle."""
+        size = self.cell_size
+        return (left // size, top // size, (left + width - 1) // size, (top + height - 1) // size)
+
+    def insert(self, key, left, top, width, height):
+        """Add key, covering the given rectangle, to the grid."""
+        bounds = self.cell_bounds(left, top, width, height)
+        self.bounds[key] = bounds
+        for cell in self._cells_in(bounds):
+            self.cells.setdefault(cell, set()).add(key)
+
+    def remove(self, key):
+        """Take key out of the grid."""
+        for cell in self._cells_in(self.bounds.pop(key)):
+            self._discard(cell, key)
+
+    def clear(self):
+        """Remove every key."""
+        self.cells.clear()
+        self.bounds.clear()
+
+    def query(self, rect):
+        """Return the set of keys in the cells that rect overlaps."""
+        found = set()
+        for cell in self._cells_in(self.cell_bounds(rect.left, rect.top, rect.width, rect.height)):
+            keys = self.cells.get(cell)
+            if keys:
+                found |= keys
+        return found
+
+    def _discard(self, cell, key):
+        """Remove key from one cell, dropping the cell once it's empty."""
+        keys = self.cells[cell]
+        keys.discard(key)
+        if not keys:
+            del self.cells[cell]
+
+    @staticmethod
+    def _cells_in(bounds):
+        """Yield every (column, row) inside bounds."""
+        first_column, first_row, last_column, last_row = bounds
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                yield column, row
+
+
+class CollisionEngine:
+    """A class to find collisions against the fleet using its spatial hash."""
+
+    def __init__(self, ai_game):
+        """Initialize the engine and its counters."""
+        self.aliens = ai_game.aliens
+        self.candidate_pairs = 0    # pairs that shared a grid cell and got an exact test
+        self.hits = 0               # pairs that actually overlapped
+
+    def groupcollide(self, bullets):
+        """Remove bullets and kill the aliens they hit, like groupcollide(bullets, aliens, True, True).
+
+        Return a dict of bullet index -> list of indices of the aliens it hit.
+        """
+        # Only bullets level with the fleet can hit it; find them all at once before any lookups.
+        top, bottom = self.aliens.vertical_span()
+        y = bullets.rect_y()
+        near = np.flatnonzero((y < bottom) & (y + bullets.settings.bullet_height > top))
+
+        collisions = {}
+        for index, rect in zip(near.tolist(), bullets.rects(near)):
+            hits = self._collide(rect)
+            if hits:
+                self.aliens.kill(hits)  # later bullets can't hit the same aliens
+                collisions[index] = hits
+        if collisions:
+            bullets.remove(list(collisions))
+        return collisions
+
+    def collideany(self, rect):
+        """Return True if rect overlaps any live alien, like spritecollideany."""
+        for index in self.aliens.candidates(rect):
+            self.candidate_pairs += 1
+            if rect.colliderect(self.aliens.alien_rect(index)):
+                self.hits += 1
+                return True
+        return False
+
+    def _collide(self, rect):
+        """Return the indices of the live aliens rect overlaps."""
+        candidates = self.aliens.candidates(rect)
+        self.candidate_pairs += len(candidates)
+        hits = [index for index in candidates if rect.colliderect(self.aliens.alien_rect(index))]
+        self.hits += len(hits)
+        return hits
+
+    def hit_ratio(self):
+        """Return the fraction of tested candidate pairs that were real hits."""
+        return self.hits / self.candidate_pairs if self.candidate_pairs else 0.0
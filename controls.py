@@ -0,0 +1,101 @@
+import pygame
+
+
+# Window events after which the display's contents may be lost; each runs the 'expose' command.
+EXPOSE_EVENTS = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWSHOWN, pygame.WINDOWRESTORED)
+
+# The only event types the game reads; pygame drops every other kind before it reaches the queue.
+EVENT_TYPES = (pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN) + EXPOSE_EVENTS
+
+# Keys that run a command when pressed, by key. Rebind with Controls.bind().
+DEFAULT_KEYMAP = {
+    pygame.K_SPACE: 'fire',
+    pygame.K_q: 'quit',                 # press Q to exit the game
+    pygame.K_F3: 'toggle_profiler',     # show or hide the profiler overlay
+    pygame.K_F4: 'export_profile',      # save the recent frame timings
+    pygame.K_F5: 'save_snapshot',       # quicksave
+    pygame.K_F9: 'load_snapshot',       # quickload
+}
+
+# Keys that count for as long as they are held, by key. Each direction runs 'move_<direction>'
+# when its first key goes down and 'stop_<direction>' when its last key comes up.
+DEFAULT_HELD_KEYS = {
+    pygame.K_RIGHT: 'right',
+    pygame.K_LEFT: 'left',
+}
+
+
+class Controls:
+    """A class to turn keyboard and mouse input into named commands through rebindable tables."""
+
+    def __init__(self, handlers, keymap=None, held_keys=None):
+        """Initialize the tables.
+
+        handlers maps each command name to a function of no arguments, except 'click',
+        which gets the mouse position.
+        """
+        self.handlers = handlers
+        self.keymap = dict(DEFAULT_KEYMAP if keymap is None else keymap)
+        self.held_keys = dict(DEFAULT_HELD_KEYS if held_keys is None else held_keys)
+        self.held = {direction: False for direction in self.held_keys.values()}
+        self.events_read = 0    # events taken off the queue so far
+        self.commands_run = 0   # handlers called so far; repeats within a frame count once
+
+    def allow_events(self):
+        """Have pygame queue only the event types the game handles; call after the display is set up."""
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(EVENT_TYPES)
+
+    def bind(self, key, command):
+        """Make pressing key run command, replacing whatever key did before."""
+        self.held_keys.pop(key, None)
+        self.keymap[key] = command
+
+    def bind_held(self, key, direction):
+        """Make holding key move in direction, replacing whatever key did before."""
+        self.keymap.pop(key, None)
+        self.held_keys[key] = direction
+        self.held.setdefault(direction, False)
+
+    def release_all(self):
+        """Forget which keys were held, so any still held start their moves again on the next poll."""
+        self.held = dict.fromkeys(self.held, False)
+
+    def poll(self):
+        """Read this frame's input and run the commands it triggered.
+
+        Every command runs at most once per frame, however many events asked for it, and
+        only the last click counts, so a flood of events costs no more than reading them.
+        """
+        commands = {}   # used as an ordered set
+        click = None
+        events = pygame.event.get()
+        self.events_read += len(events)
+        for event in events:
+            if event.type == pygame.KEYDOWN:
+                command = self.keymap.get(event.key)
+                if command:
+                    commands[command] = None
+            elif event.type == pygame.MOUSEBUTTONDOWN:  # MouseButtonDown event
+                click = event.pos   # cursor's x- and y-coordinates
+            elif event.type == pygame.QUIT:
+                commands['quit'] = None
+            elif event.type in EXPOSE_EVENTS:   # window uncovered or restored
+                commands['expose'] = None
+
+        # Held keys are polled rather than tracked through KEYUP events, so none can get stuck.
+        pressed = pygame.key.get_pressed()
+        held = dict.fromkeys(self.held, False)
+        for key, direction in self.held_keys.items():
+            if pressed[key]:
+                held[direction] = True
+        for direction, is_held in held.items():
+            if is_held != self.held[direction]:
+                self.held[direction] = is_held
+                commands[('move_' if is_held else 'stop_') + direction] = None
+
+        for command in commands:
+            self.handlers[command]()
+        if click is not None:
+            self.handlers['click'](click)
+        self.commands_run += len(commands) + (click is not None)
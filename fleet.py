@@ -0,0 +1,170 @@
+import math
+
+import numpy as np
+import pygame
+
+from collision import SpatialHash, rect_round
+
+
+class Fleet:
+    """A class to manage the whole alien fleet as arrays instead of one sprite per alien."""
+
+    def __init__(self, ai_game):
+        """Initialize an empty fleet."""
+        self.screen = ai_game.screen
+        self.screen_rect = self.screen.get_rect()
+        self.settings = ai_game.settings
+
+        # Every alien shares one image, so the fleet only needs its size.
+        self.image = ai_game.assets.get('alien')
+        self.width, self.height = self.image.get_size()
+
+        # One entry per alien: exact horizontal position, top edge, and whether it's still alive.
+        self.x = np.empty(0, dtype=np.float64)
+        self.y = np.empty(0, dtype=np.int64)
+        self.alive = np.empty(0, dtype=bool)
+        self.count = 0      # number of live aliens
+        self.spawned = 0    # aliens of this wave brought in so far; the rest are still arriving
+        self.spawn_per_tick = 0
+
+        # Backing storage reused by every wave that fits, so new fleets don't allocate
+        self._x_buffer = self.x
+        self._y_buffer = self.y
+        self._alive_buffer = self.alive
+        self.buffer_allocations = 0
+        self.buffer_reuses = 0
+
+        self.last_dx = 0.0  # how far the fleet moved on the last tick, for interpolated drawing
+
+        # Grid of live aliens for collision lookups. The fleet only ever moves as one block, so
+        # aliens are bucketed where they are relative to the fleet, and the grid changes only on
+        # spawn and kill; queries are shifted by how far the fleet has moved instead.
+        self.grid = SpatialHash(self.settings.collision_cell_size)
+        self.offset_x = 0.0     # how far the fleet has moved since this wave spawned
+        self.offset_y = 0
+        self._span = (0, 0)     # top and bottom of the wave as it spawned
+
+    def __len__(self):
+        """Return the number of live aliens, counting those still arriving."""
+        return self.count + len(self.x) - self.spawned
+
+    def spawn(self, x, y, per_tick=0):
+        """Replace the fleet with aliens at the given top-left positions.
+
+        With per_tick, only that many aliens appear at once and each update() brings in
+        the next batch, so a big wave doesn't all arrive on one frame.
+        """
+        count = len(x)
+        if count > len(self._x_buffer):
+            self._x_buffer = np.empty(count, dtype=np.float64)
+            self._y_buffer = np.empty(count, dtype=np.int64)
+            self._alive_buffer = np.empty(count, dtype=bool)
+            self.buffer_allocations += 1
+        else:
+            self.buffer_reuses += 1
+
+        self.x = self._x_buffer[:count]
+        self.y = self._y_buffer[:count]
+        self.alive = self._alive_buffer[:count]
+        self.x[:] = x
+        self.y[:] = y
+        self.alive[:] = False
+        self.count = 0
+        self.spawned = 0
+        self.spawn_per_tick = per_tick or count
+        self.last_dx = 0.0
+
+        self.grid.clear()
+        self.offset_x = 0.0
+        self.offset_y = 0
+        self._span = (int(self.y.min()), int(self.y.max()) + self.height) if count else (0, 0)
+        self._spawn_batch()
+
+    def _spawn_batch(self):
+        """Bring in the next batch of aliens of the current wave."""
+        end = min(self.spawned + self.spawn_per_tick, len(self.x))
+        # Aliens arriving after the fleet moved go where they would have been at spawn.
+        x = np.rint(self.x - self.offset_x).astype(np.int64)
+        y = self.y - self.offset_y
+        for index in range(self.spawned, end):
+            self.grid.insert(index, int(x[index]), int(y[index]), self.width, self.height)
+        self.alive[self.spawned:end] = True
+        self.count += end - self.spawned
+        self.spawned = end
+
+    def restore(self, x, y, alive, spawned, spawn_per_tick, last_dx):
+        """Replace the fleet with a saved one, including a wave that is still arriving."""
+        self.spawn(x, y, spawn_per_tick)
+        while self.spawned < spawned:
+            self._spawn_batch()
+        self.kill(np.flatnonzero(~np.asarray(alive)[:self.spawned]).tolist())
+        self.last_dx = last_dx
+
+    def empty(self):
+        """Remove every alien."""
+        self.spawn([], [])
+
+    def rect_x(self):
+        """Return the aliens' horizontal positions rounded to pixels, like pygame.Rect does."""
+        return rect_round(self.x)
+
+    def update(self):
+        """Bring in any aliens still arriving, and move the fleet right or left."""
+        if self.spawned < len(self.x):
+            self._spawn_batch()
+        self.last_dx = self.settings.alien_speed * self.settings.fleet_direction
+        self.x += self.last_dx
+        self.offset_x += self.last_dx
+
+    def check_edges(self):
+        """Return True if any live alien is at an edge of the screen."""
+        if not self.count:
+            return False
+        left = int(rect_round(self.x.min(where=self.alive, initial=np.inf)))
+        right = int(rect_round(self.x.max(where=self.alive, initial=-np.inf))) + self.width
+        return right >= self.screen_rect.right or left <= 0     # fleet is at right/left edge
+
+    def drop(self, distance):
+        """Move the whole fleet down by distance pixels."""
+        self.y += distance
+        self.offset_y += distance
+
+    def check_bottom(self):
+        """Return True if any live alien has reached the bottom of the screen."""
+        if not self.count:
+            return False
+        bottom = self.y.max(where=self.alive, initial=np.iinfo(np.int64).min) + self.height
+        return bottom >= self.screen_rect.bottom
+
+    def candidates(self, rect):
+        """Return the indices of live aliens sharing a grid cell with rect.
+
+        The query is widened by a pixel on each side, since an alien's rounded position can
+        differ by one from its spawn position plus the rounded offset.
+        """
+        left = math.floor(rect.left - self.offset_x) - 1
+        return self.grid.query(pygame.Rect(left, rect.top - self.offset_y - 1, rect.width + 2, rect.height + 2))
+
+    def vertical_span(self):
+        """Return the top and bottom between which every alien of the wave lies."""
+        top, bottom = self._span
+        return top + self.offset_y, bottom + self.offset_y
+
+    def alien_rect(self, index):
+        """Return the Rect of the alien at index."""
+        rect = pygame.Rect(0, int(self.y[index]), self.width, self.height)
+        rect.x = float(self.x[index])   # pygame does the rounding, as it does for the ship
+        return rect
+
+    def kill(self, indices):
+        """Mark the aliens at indices as dead."""
+        self.alive[indices] = False
+        self.count = int(np.count_nonzero(self.alive))
+        for index in indices:
+            self.grid.remove(index)
+
+    def draw(self, alpha=1.0):
+        """Draw every live alien between its last two positions and return the drawn Rects."""
+        x = rect_round(self.x[self.alive] - self.last_dx * (1 - alpha))
+        y = self.y[self.alive]
+        return self.screen.blits([(self.image, position) for position in zip(x.tolist(), y.tolist())])
@@ -0,0 +1,81 @@
+import numpy as np
+
+
+def grid_size(screen_width, screen_height, alien_width, alien_height, ship_height):
+    """Return how many aliens fit in a row, and how many rows fit, with one alien of spacing."""
+    available_space_x = screen_width - (2 * alien_width)    # Horizontal space available for aliens
+    number_alien_x = available_space_x // (2 * alien_width)     # number of aliens can fit into the space
+    # available vertical space
+    available_space_y = screen_height - (3 * alien_height) - ship_height
+    number_rows = available_space_y // (2 * alien_height)
+    return number_alien_x, number_rows
+
+
+def grid_formation(screen_width, screen_height, alien_width, alien_height, ship_height):
+    """Return the classic formation: full rows of aliens, one alien apart."""
+    number_alien_x, number_rows = grid_size(screen_width, screen_height, alien_width, alien_height, ship_height)
+    alien_numbers, row_numbers = np.meshgrid(np.arange(number_alien_x), np.arange(number_rows))
+    return (alien_width + 2 * alien_width * alien_numbers.ravel(),
+            alien_height + 2 * alien_height * row_numbers.ravel())
+
+
+def staggered_formation(screen_width, screen_height, alien_width, alien_height, ship_height):
+    """Return a grid whose odd rows are shifted half a slot right and one alien shorter."""
+    x, y = grid_formation(screen_width, screen_height, alien_width, alien_height, ship_height)
+    number_alien_x, _ = grid_size(screen_width, screen_height, alien_width, alien_height, ship_height)
+    odd_row = (y // (2 * alien_height)) % 2 == 1
+    last_in_row = (x // (2 * alien_width)) == number_alien_x - 1
+    keep = ~(odd_row & last_in_row)
+    return x[keep] + odd_row[keep] * alien_width, y[keep]
+
+
+def wedge_formation(screen_width, screen_height, alien_width, alien_height, ship_height):
+    """Return a formation that widens by one alien on each side with every row, like an arrowhead."""
+    x, y = grid_formation(screen_width, screen_height, alien_width, alien_height, ship_height)
+    number_alien_x, _ = grid_size(screen_width, screen_height, alien_width, alien_height, ship_height)
+    column = x // (2 * alien_width)
+    row = y // (2 * alien_height)
+    middle = (number_alien_x - 1) / 2
+    keep = np.abs(column - middle) <= row + 0.5
+    return x[keep], y[keep]
+
+
+# The built-in formations, by name
+FORMATIONS = {
+    'grid': grid_formation,
+    'staggered': staggered_formation,
+    'wedge': wedge_formation,
+}
+
+
+class FleetLayouts:
+    """A class to compute each fleet formation once per screen and sprite size and reuse it."""
+
+    def __init__(self):
+        """Initialize the built-in formations and an empty cache."""
+        self.formations = dict(FORMATIONS)
+        self._cache = {}
+        self.hits = 0
+        self.misses = 0
+
+    def register(self, name, formation):
+        """Add a formation: a function of (screen_width, screen_height, alien_width, alien_height,
+        ship_height) returning arrays of the aliens' x and y positions."""
+        self.formations[name] = formation
+        self._cache = {key: value for key, value in self._cache.items() if key[0] != name}
+
+    def get(self, name, screen_size, alien_size, ship_height):
+        """Return read-only (x, y) arrays for a formation, computing them only the first time."""
+        key = (name, screen_size, alien_size, ship_height)
+        layout = self._cache.get(key)
+        if layout is not None:
+            self.hits += 1
+            return layout
+
+        self.misses += 1
+        x, y = self.formations[name](*screen_size, *alien_size, ship_height)
+        layout = (np.array(x, dtype=np.float64), np.array(y, dtype=np.int64))
+        for array in layout:
+            array.flags.writeable = False   # shared by every wave; the fleet copies it
+        self._cache[key] = layout
+        return layout
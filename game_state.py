@@ -0,0 +1,63 @@
+class GameState:
+    """A class to track the game's phase and time the pauses between phases without blocking."""
+
+    PLAYING = 'playing'
+    RESPAWNING = 'respawning'
+    LEVEL_TRANSITION = 'level transition'
+    GAME_OVER = 'game over'
+    PHASES = (PLAYING, RESPAWNING, LEVEL_TRANSITION, GAME_OVER)
+
+    def __init__(self, tick_rate, skip_delays=False):
+        """Initialize the state machine in the game-over phase.
+
+        With skip_delays, timed phases end at once; simulations use this to skip pauses.
+        """
+        self.tick_rate = tick_rate
+        self.skip_delays = skip_delays
+        self.phase = self.GAME_OVER
+        self.ticks_left = 0     # simulation ticks until the current timed phase ends
+        self._on_done = None    # called when the timed phase ends
+
+    def enter(self, phase, seconds=0.0, on_done=None):
+        """Switch to phase.
+
+        If seconds is given, the phase lasts that much game time; then on_done is called
+        and the game goes back to playing.
+        """
+        self.phase = phase
+        self._on_done = on_done
+        self.ticks_left = 0 if self.skip_delays else round(seconds * self.tick_rate)
+        if seconds and not self.ticks_left:
+            self._finish()
+
+    @property
+    def on_done(self):
+        """Return the function called when the current timed phase ends, or None."""
+        return self._on_done
+
+    def resume(self, phase, ticks_left, on_done=None):
+        """Put the machine back in phase with ticks_left to go, e.g. from a snapshot."""
+        if phase not in self.PHASES:
+            raise ValueError(f"unknown game phase {phase!r}")
+        self.phase = phase
+        self.ticks_left = ticks_left
+        self._on_done = on_done
+
+    def advance(self):
+        """Count down one simulation tick of the current timed phase."""
+        if self.ticks_left:
+            self.ticks_left -= 1
+            if not self.ticks_left:
+                self._finish()
+
+    def is_playing(self):
+        """Return True if the simulation should run this tick."""
+        return self.phase == self.PLAYING
+
+    def _finish(self):
+        """End the timed phase and resume play."""
+        on_done = self._on_done
+        self._on_done = None
+        self.phase = self.PLAYING   # set first, so on_done can switch to another phase
+        if on_done:
+            on_done()
@@ -6,8 +6,10 @@ class GameStats:
         self.settings = ai_game.settings
         self.reset_stats()
         self.game_active = False   # Start Alien Invasion in an active state
-        # High score should never be reset.
-        self.high_score = 0
+        # High score should never be reset; it starts from the saved leaderboard, which is only
+        # read once the first frame is up, unless something asks for it sooner.
+        high_scores = ai_game.high_scores
+        self.high_score = high_scores.best() if high_scores.loaded else 0
 
     def reset_stats(self):
         """Initialize statistics that can change during the game."""
@@ -0,0 +1,134 @@
+import argparse
+import random
+import time
+
+from actions import Action
+from alien_invasion import AlienInvasion
+from profiles import add_profile_argument, load_settings
+from snapshot import capture
+
+
+def steer(ai_game, moving_left, moving_right):
+    """Return the actions that set the ship's movement flags, skipping ones already in effect."""
+    ship = ai_game.ship
+    actions = []
+    if moving_left != ship.moving_left:
+        actions.append(Action.MOVE_LEFT if moving_left else Action.STOP_LEFT)
+    if moving_right != ship.moving_right:
+        actions.append(Action.MOVE_RIGHT if moving_right else Action.STOP_RIGHT)
+    return actions
+
+
+class RandomPolicy:
+    """An input source that moves and fires at random."""
+
+    def __init__(self, seed=None, fire_chance=0.2, turn_chance=0.02):
+        """Initialize the policy's random generator and odds per tick."""
+        self.random = random.Random(seed)
+        self.fire_chance = fire_chance
+        self.turn_chance = turn_chance
+        self.direction = 0      # -1 left, 0 still, 1 right
+
+    def actions(self, ai_game):
+        """Return this tick's actions: maybe turn, and maybe fire."""
+        if self.random.random() < self.turn_chance:
+            self.direction = self.random.choice((-1, 0, 1))
+        actions = steer(ai_game, self.direction < 0, self.direction > 0)
+        if self.random.random() < self.fire_chance:
+            actions.append(Action.FIRE)
+        return actions
+
+
+class ScriptedPolicy:
+    """An input source that loops over a fixed list of (left, right, fire) steps."""
+
+    def __init__(self, steps):
+        """Initialize the policy with one (moving_left, moving_right, fire) tuple per tick."""
+        self.steps = steps
+        self.tick = 0   # ticks this policy has played
+
+    def actions(self, ai_game):
+        """Return the actions for this tick's step."""
+        moving_left, moving_right, fire = self.steps[self.tick % len(self.steps)]
+        self.tick += 1
+        actions = steer(ai_game, moving_left, moving_right)
+        if fire:
+            actions.append(Action.FIRE)
+        return actions
+
+
+def sweep_policy(period=400):
+    """Return a policy that sweeps the ship left and right while firing every tick."""
+    half = period // 2
+    return ScriptedPolicy([(False, True, True)] * half + [(True, False, True)] * half)
+
+
+def run_headless(ticks, policy=None, render=False, settings=None, ai_game=None, restart=True):
+    """Simulate ticks fixed steps as fast as possible and return the game.
+
+    The policy becomes the game's input source. When render is True, a frame is drawn
+    as often as the real loop would draw one. When restart is True, a new game starts
+    as soon as the last one ends.
+    """
+    ai = ai_game or AlienInvasion(settings=settings, headless=True)
+    ai.input_source = policy or sweep_policy()
+    render_every = max(1, ai.settings.tick_rate // max(1, ai.settings.max_fps))
+
+    if not ai.stats.game_active:
+        ai._start_game()
+    for tick in range(ticks):
+        if not ai.stats.game_active:
+            if not restart:
+                break
+            ai._start_game()
+        ai._update_game()
+        if render and tick % render_every == 0:
+            ai._update_screen()
+    return ai
+
+
+def main():
+    """Run a headless session from the command line and print a summary."""
+    parser = argparse.ArgumentParser(description="Run Alien Invasion without a window.")
+    parser.add_argument('--ticks', type=int, default=10000, help="simulation ticks to run")
+    parser.add_argument('--policy', choices=('random', 'sweep'), default='random')
+    parser.add_argument('--seed', type=int, default=0, help="seed for the random policy")
+    parser.add_argument('--render', action='store_true', help="also draw frames to the dummy display")
+    parser.add_argument('--full-redraw', action='store_true',
+                        help="with --render, push the whole screen every frame instead of only what changed")
+    parser.add_argument('--save-snapshot', metavar='FILE', help="save the final game state, e.g. for benchmark.py")
+    parser.add_argument('--startup-report', action='store_true', help="print how long each startup phase took")
+    add_profile_argument(parser)
+    args = parser.parse_args()
+
+    policy = RandomPolicy(args.seed) if args.policy == 'random' else sweep_policy()
+    start = time.perf_counter()
+    settings = load_settings(args.profile)
+    if args.full_redraw:
+        settings.full_redraw = True
+    ai = AlienInvasion(settings=settings, headless=True)
+    with ai.startup.phase('first tick'):
+        run_headless(1, policy, render=args.render, ai_game=ai)
+    run_headless(args.ticks - 1, policy, render=args.render, ai_game=ai)
+    elapsed = time.perf_counter() - start
+
+    print(f"{args.ticks} ticks in {elapsed:.2f}s ({args.ticks / elapsed:,.0f} ticks/s)")
+    print(f"score {ai.stats.score:,}  level {ai.stats.level}  ships left {ai.stats.ships_left}")
+    pool = ai.bullets.report()
+    print(f"bullets: {pool['capacity']} slots, {pool['reuse_rate']:.1%} of shots reused a slot, "
+          f"{pool['grows']} grows, {pool['gc_collections']} GC collections")
+    if args.render:
+        hud = ai.scoreboard.report()
+        print(f"HUD: {hud['invalidations']} invalidations, {hud['renders']} renders, {hud['frames']} frames drawn")
+        pixels = ai.renderer.average_pixels_pushed()
+        screen = ai.settings.screen_width * ai.settings.screen_height
+        print(f"display: {pixels:,.0f} pixels pushed per frame ({pixels / screen:.1%} of the screen, "
+              f"{'full redraw' if ai.renderer.full_redraw else 'dirty rects'})")
+    if args.startup_report:
+        print(ai.startup.report())
+    if args.save_snapshot:
+        capture(ai).save(args.save_snapshot)
+
+
+if __name__ == '__main__':
+    main()
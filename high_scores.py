@@ -0,0 +1,116 @@
+import json
+import os
+import tempfile
+import threading
+import time
+
+
+class HighScoreStore:
+    """A class to keep a top-N leaderboard on disk without making the game wait for it."""
+
+    def __init__(self, path, size=10):
+        """Start the background writer; the leaderboard is read from path on first use, or by load().
+
+        With path None the leaderboard lives in memory only.
+        """
+        self.path = path
+        self.size = size
+        self.entries = []       # dicts of score, level and time, best first
+        self.loaded = False     # whether the file has been read into entries
+
+        self.submitted = 0  # entries that made the leaderboard
+        self.writes = 0     # files actually written; several submits can share one
+        self._saved = 0     # value of submitted as of the last successful write
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = False
+        self._writer = None
+        if path:
+            self._writer = threading.Thread(target=self._write_loop, name='high-score-writer', daemon=True)
+            self._writer.start()
+
+    def load(self):
+        """Read the saved leaderboard, if it hasn't been read yet."""
+        if not self.loaded:
+            self.entries = self._load()
+            self.loaded = True
+
+    def best(self):
+        """Return the top score, or 0 if there are none yet."""
+        self.load()
+        return self.entries[0]['score'] if self.entries else 0
+
+    def submit(self, score, level):
+        """Add a finished game to the leaderboard if it qualifies; saving happens in the background."""
+        if score <= 0:
+            return False
+        self.load()     # never save over scores that haven't been read
+        with self._lock:
+            if len(self.entries) >= self.size and score <= self.entries[-1]['score']:
+                return False
+            self.entries.append({'score': score, 'level': level,
+                                 'time': time.strftime('%Y-%m-%dT%H:%M:%S')})
+            self.entries.sort(key=lambda entry: entry['score'], reverse=True)
+            del self.entries[self.size:]
+            self.submitted += 1
+        self._wake.set()
+        return True
+
+    def close(self):
+        """Write any pending change and stop the writer thread."""
+        if self._writer:
+            self._stopping = True
+            self._wake.set()
+            self._writer.join()
+            self._writer = None
+
+    def _load(self):
+        """Return the saved leaderboard, or an empty one if there is no readable file.
+
+        Entries without a numeric score are unreadable and left out.
+        """
+        if not self.path:
+            return []
+        try:
+            with open(self.path) as file:
+                entries = json.load(file)
+        except (OSError, ValueError):
+            return []
+        if not isinstance(entries, list):
+            return []
+        entries = [entry for entry in entries if isinstance(entry, dict)
+                   and isinstance(entry.get('score'), (int, float)) and not isinstance(entry['score'], bool)]
+        return sorted(entries, key=lambda entry: entry['score'], reverse=True)[:self.size]
+
+    def _write_loop(self):
+        """Wait for changes and save them, coalescing changes that arrive while a write is running."""
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            if self.submitted > self._saved:
+                self._flush()
+            if self._stopping:
+                return
+
+    def _flush(self):
+        """Save the leaderboard atomically: write a temp file, then rename it over the old one."""
+        with self._lock:
+            data = json.dumps(self.entries, indent=1)
+            submitted = self.submitted
+        temp_path = None
+        try:
+            # A temp file of its own, so games sharing the leaderboard can't write over each other's
+            with tempfile.NamedTemporaryFile('w', dir=os.path.dirname(self.path) or '.',
+                                             prefix=os.path.basename(self.path) + '.', suffix='.tmp',
+                                             delete=False) as file:
+                temp_path = file.name
+                file.write(data)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, self.path)
+        except OSError:
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
+            return      # keep the old file; the next submit tries again
+        self._saved = submitted
+        self.writes += 1
@@ -0,0 +1,195 @@
+import csv
+import json
+from collections import deque
+from time import perf_counter
+
+import numpy as np
+import pygame.font
+
+
+class _Scope:
+    """A reusable timing scope; time spent in nested scopes is charged to them, not to this one."""
+
+    def __init__(self, profiler, name):
+        """Initialize a scope that reports to profiler under name."""
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+        self.children = 0.0     # time spent in scopes nested inside this one
+
+    def __enter__(self):
+        self.start = perf_counter()
+        self.children = 0.0
+        self.profiler._stack.append(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = perf_counter() - self.start
+        stack = self.profiler._stack
+        stack.pop()
+        if stack:
+            stack[-1].children += elapsed
+        self.profiler._add(self.name, elapsed - self.children)
+
+
+class StartupTimer:
+    """A class to time each phase of starting the game, from launch to the first frame."""
+
+    def __init__(self):
+        """Start the clock; phases are timed from here."""
+        self.start = perf_counter()
+        self.phases = {}    # phase -> seconds, in the order the phases ran
+        self._phase = None
+        self._phase_start = 0.0
+        self._last_end = self.start     # when the latest phase finished
+
+    def phase(self, name):
+        """Return a context manager that times its block as the startup phase name."""
+        self._phase = name
+        return self
+
+    def __enter__(self):
+        self._phase_start = perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._last_end = perf_counter()
+        self.phases[self._phase] = self.phases.get(self._phase, 0.0) + self._last_end - self._phase_start
+
+    def total(self):
+        """Return the seconds from the start to the end of the latest phase, gaps included."""
+        return self._last_end - self.start
+
+    def report(self):
+        """Return the phase timings as text, one line per phase, with the total."""
+        lines = [f"{name:<16}{seconds * 1000:>8.1f} ms" for name, seconds in self.phases.items()]
+        lines.append(f"{'total':<16}{self.total() * 1000:>8.1f} ms")
+        return '\n'.join(lines)
+
+
+class Profiler:
+    """A class to time named phases of the main loop and keep recent frames in a ring buffer."""
+
+    def __init__(self, capacity=600):
+        """Initialize an empty profiler that keeps the last capacity frames."""
+        self.frames = deque(maxlen=capacity)    # (frame seconds, {scope: seconds}) per frame
+        self.totals = {}    # scope -> seconds over the profiler's whole life
+        self._scopes = {}
+        self._stack = []
+        self._current = {}
+        self._frame_start = None
+
+    def scope(self, name):
+        """Return a context manager that times its block under name."""
+        scope = self._scopes.get(name)
+        if scope is None:
+            scope = self._scopes[name] = _Scope(self, name)
+        return scope
+
+    def begin_frame(self):
+        """Start timing a new frame."""
+        self._frame_start = perf_counter()
+        self._current = {}
+
+    def end_frame(self):
+        """Finish the frame and push its sample into the ring buffer."""
+        if self._frame_start is not None:
+            self.frames.append((perf_counter() - self._frame_start, self._current))
+        self._frame_start = None
+
+    def reset(self):
+        """Forget every sample and total."""
+        self.frames.clear()
+        self.totals.clear()
+
+    def scope_names(self):
+        """Return every scope name seen so far, in first-seen order."""
+        return list(self.totals)
+
+    def percentiles(self, percents=(50, 95, 99)):
+        """Return {'frame': [...], scope: [...]} percentiles in milliseconds over the buffered frames."""
+        if not self.frames:
+            return {}
+        stats = {'frame': np.percentile([total for total, _ in self.frames], percents) * 1000}
+        for name in self.scope_names():
+            times = [scopes.get(name, 0.0) for _, scopes in self.frames]
+            stats[name] = np.percentile(times, percents) * 1000
+        return stats
+
+    def export_csv(self, path):
+        """Write the buffered frames to path as CSV, one row per frame, in milliseconds."""
+        names = self.scope_names()
+        with open(path, 'w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(['frame', 'frame_ms'] + [f"{name}_ms" for name in names])
+            for index, (total, scopes) in enumerate(self.frames):
+                writer.writerow([index, f"{total * 1000:.4f}"]
+                                + [f"{scopes.get(name, 0.0) * 1000:.4f}" for name in names])
+
+    def export_json(self, path):
+        """Write the buffered frames and their percentiles to path as JSON, in milliseconds."""
+        trace = {
+            'percentiles': {name: {f"p{percent}": round(value, 4) for percent, value in zip((50, 95, 99), stats)}
+                            for name, stats in self.percentiles().items()},
+            'frames': [{'frame_ms': round(total * 1000, 4),
+                        **{name: round(seconds * 1000, 4) for name, seconds in scopes.items()}}
+                       for total, scopes in self.frames],
+        }
+        with open(path, 'w') as file:
+            json.dump(trace, file, indent=1)
+
+    def _add(self, name, seconds):
+        """Charge seconds to name in the current frame and in the totals."""
+        self._current[name] = self._current.get(name, 0.0) + seconds
+        self.totals[name] = self.totals.get(name, 0.0) + seconds
+
+
+class ProfilerOverlay:
+    """A class to show frame-time statistics on top of the game."""
+
+    def __init__(self, ai_game, refresh_frames=30):
+        """Initialize the overlay, hidden, refreshing its text every refresh_frames frames."""
+        self.screen = ai_game.screen
+        self.screen_rect = self.screen.get_rect()
+        self.profiler = ai_game.profiler
+        self.refresh_frames = refresh_frames
+        self.visible = False
+
+        self.text_color = (0, 0, 0)
+        self.bg_color = (255, 255, 200)
+        self.text_cache = ai_game.text_cache
+        self.font = None    # loaded the first time the overlay is shown
+        self.image = None
+        self._frames_until_refresh = 0
+
+    def toggle(self):
+        """Show or hide the overlay."""
+        self.visible = not self.visible
+        self._frames_until_refresh = 0
+
+    def draw(self):
+        """Draw the overlay at the bottom left and return its Rect."""
+        if self._frames_until_refresh <= 0 or self.image is None:
+            self._prep_image()
+            self._frames_until_refresh = self.refresh_frames
+        self._frames_until_refresh -= 1
+
+        rect = self.image.get_rect()
+        rect.bottomleft = (10, self.screen_rect.bottom - 10)
+        return self.screen.blit(self.image, rect)
+
+    def _prep_image(self):
+        """Render the current percentiles into one image, a line per scope."""
+        if self.font is None:
+            self.font = self.text_cache.font(22)
+        lines = ["ms           p50      p95      p99"]
+        for name, (p50, p95, p99) in self.profiler.percentiles().items():
+            lines.append(f"{name:<12}{p50:>7.2f}  {p95:>7.2f}  {p99:>7.2f}")
+        images = [self.font.render(line, True, self.text_color, self.bg_color) for line in lines]
+
+        line_height = self.font.get_linesize()
+        self.image = pygame.Surface((max(image.get_width() for image in images) + 10,
+                                     line_height * len(images) + 10))
+        self.image.fill(self.bg_color)
+        for number, image in enumerate(images):
+            self.image.blit(image, (5, 5 + number * line_height))
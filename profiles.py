@@ -0,0 +1,185 @@
+import json
+import os
+import sys
+import time
+
+from fleet_layouts import FORMATIONS
+from settings import Settings
+
+
+# Profiles named on the command line are looked up here when they aren't a path.
+PROFILE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'profiles')
+
+# Settings that initialize_dynamic_settings() and increase_speed() derive; profiles set their initial_ values.
+DYNAMIC = ('ship_speed', 'bullet_speed', 'alien_speed', 'fleet_direction', 'alien_points')
+
+# Settings a running game can't pick up; a reload leaves them alone until the next start.
+RESTART_ONLY = ('screen_width', 'screen_height', 'fullscreen', 'sprite_scale', 'tick_rate',
+                'collision_cell_size', 'high_score_file', 'leaderboard_size')
+
+# Numbers that must be above zero; every other number only has to be zero or more.
+POSITIVE = ('screen_width', 'screen_height', 'tick_rate', 'max_ticks_per_frame', 'bullet_width',
+            'bullet_height', 'collision_cell_size', 'leaderboard_size', 'speedup_scale', 'score_scale')
+
+
+# String settings that name one of a fixed set of things, and where those names are kept.
+CHOICES = {'fleet_formation': FORMATIONS}
+
+
+class ProfileError(ValueError):
+    """Raised when a settings profile can't be found or read, or doesn't match the schema."""
+
+
+def defaults():
+    """Return {name: default value} for every setting a profile may set."""
+    return {name: value for name, value in vars(Settings()).items() if name not in DYNAMIC}
+
+
+def validate(values, source='profile', choices=None):
+    """Check values against the types and ranges of the defaults and return them normalized.
+
+    Whole numbers are accepted for float settings, and lists for colors. Names such as
+    fleet_formation must be in choices, which defaults to CHOICES; pass a game's own
+    names to allow formations registered with its FleetLayouts. Every problem is reported
+    at once in the ProfileError.
+    """
+    schema = defaults()
+    choices = CHOICES if choices is None else {**CHOICES, **choices}
+    errors = []
+    normalized = {}
+    for name, value in values.items():
+        if name not in schema:
+            errors.append(f"unknown setting {name!r}")
+            continue
+        default = schema[name]
+        if isinstance(default, bool):
+            valid = isinstance(value, bool)
+        elif isinstance(default, int):
+            valid = isinstance(value, int) and not isinstance(value, bool)
+        elif isinstance(default, float):
+            valid = isinstance(value, (int, float)) and not isinstance(value, bool)
+            value = float(value) if valid else value
+        elif isinstance(default, tuple):    # an RGB color
+            valid = (isinstance(value, (list, tuple)) and len(value) == 3
+                     and all(isinstance(part, int) and not isinstance(part, bool) and 0 <= part <= 255
+                             for part in value))
+            value = tuple(value) if valid else value
+        else:
+            valid = isinstance(value, type(default))
+        if not valid:
+            errors.append(f"{name} must be like {default!r}, not {value!r}")
+        elif isinstance(value, (int, float)) and not isinstance(value, bool) and (
+                value < 0 or (value == 0 and name in POSITIVE)):
+            errors.append(f"{name} must be {'above' if name in POSITIVE else 'at least'} 0, not {value!r}")
+        elif name in choices and value not in choices[name]:
+            errors.append(f"{name} must be one of {', '.join(map(repr, choices[name]))}, not {value!r}")
+        else:
+            normalized[name] = value
+    if errors:
+        raise ProfileError(f"{source}: " + '; '.join(errors))
+    return normalized
+
+
+def find_profile(name):
+    """Return the path of a profile given as a path, or as a name in the profiles directory."""
+    if os.path.isfile(name):
+        return name
+    for extension in ('.toml', '.json'):
+        path = os.path.join(PROFILE_DIR, name + extension)
+        if os.path.isfile(path):
+            return path
+    available = sorted(os.path.splitext(file)[0] for file in os.listdir(PROFILE_DIR)) \
+        if os.path.isdir(PROFILE_DIR) else []
+    raise ProfileError(f"no profile {name!r}; available: {', '.join(available) or 'none'}")
+
+
+def _toml():
+    """Return the TOML reader: tomllib from Python 3.11, or the tomli package it came from."""
+    try:
+        import tomllib
+    except ModuleNotFoundError:
+        try:
+            import tomli as tomllib
+        except ModuleNotFoundError:
+            raise ProfileError("TOML profiles need Python 3.11 or the tomli package; "
+                               "use a JSON profile instead") from None
+    return tomllib
+
+
+def read_profile(path, choices=None):
+    """Read and validate a TOML or JSON profile, returning only the settings it sets."""
+    toml = None if path.endswith('.json') else _toml()  # imported only when a TOML file is read
+    try:
+        if toml is None:
+            with open(path) as file:
+                values = json.load(file)
+        else:
+            with open(path, 'rb') as file:
+                values = toml.load(file)
+    except (OSError, ValueError) as error:  # JSON and TOML syntax errors are both ValueErrors
+        raise ProfileError(f"{path}: {error}") from error
+    if not isinstance(values, dict):
+        raise ProfileError(f"{path}: a profile must be a table of settings")
+    return validate(values, path, choices)
+
+
+def load_settings(profile=None):
+    """Return Settings with the named profile (a name or a path) applied, or the defaults if None."""
+    settings = Settings()
+    if profile:
+        for name, value in read_profile(find_profile(profile)).items():
+            setattr(settings, name, value)
+        settings.initialize_dynamic_settings()  # start from the profile's initial speeds and points
+    return settings
+
+
+def add_profile_argument(parser):
+    """Add the --profile option shared by the command-line tools."""
+    parser.add_argument('--profile', metavar='NAME', help="settings profile: a TOML/JSON file, "
+                                                          "or a name in the profiles directory")
+
+
+class ProfileWatcher:
+    """A class to notice when a profile file changes and read it again."""
+
+    def __init__(self, path, interval=0.5, choices=None):
+        """Watch path, checking it at most once every interval seconds, and validate it with choices."""
+        self.path = path
+        self.interval = interval
+        self.choices = choices
+        self.reloads = 0    # changes that were valid and handed back
+        self.errors = 0     # changes that failed to read or validate
+        self._next_check = 0.0
+        self._stamp = self._file_stamp()
+
+    def poll(self):
+        """Return the full settings (defaults overlaid with the file) if the file changed, else None.
+
+        A change that doesn't validate is reported on stderr and skipped; the game keeps
+        its current settings until the file is fixed.
+        """
+        now = time.monotonic()
+        if now < self._next_check:
+            return None
+        self._next_check = now + self.interval
+        stamp = self._file_stamp()
+        if stamp == self._stamp:
+            return None
+        self._stamp = stamp
+
+        try:
+            values = read_profile(self.path, self.choices)
+        except ProfileError as error:
+            self.errors += 1
+            print(f"settings not reloaded: {error}", file=sys.stderr)
+            return None
+        self.reloads += 1
+        return {**defaults(), **values}     # a setting removed from the file goes back to its default
+
+    def _file_stamp(self):
+        """Return what identifies this version of the file: its modification time and size."""
+        try:
+            status = os.stat(self.path)
+        except OSError:
+            return None
+        return status.st_mtime_ns, status.st_size
@@ -0,0 +1,154 @@
+import hashlib
+import struct
+
+
+# File layout: a header, then records of (tick, code); checkpoint and end records add a state hash.
+MAGIC = b'AIRP'
+VERSION = 2
+# magic, version, skip_delays, tick_rate, screen width, screen height, sprite scale
+HEADER = struct.Struct('<4sBBHHHd')
+HEADER_V1 = struct.Struct('<4sBBHHH')   # version 1 had no sprite scale; those sessions ran at 1
+RECORD = struct.Struct('<IB')       # tick, action or marker code
+HASH = struct.Struct('<Q')
+
+# Record codes that aren't input actions
+CHECKPOINT = 100
+END = 101
+
+
+def state_hash(ai_game):
+    """Return a 64-bit hash of everything the simulation depends on."""
+    digest = hashlib.blake2b(digest_size=8)
+    stats, settings, ship = ai_game.stats, ai_game.settings, ai_game.ship
+    bullets = ai_game.bullets
+    digest.update(repr((
+        ai_game.ticks, ai_game.state.phase, ai_game.state.ticks_left,
+        stats.game_active, stats.score, stats.level, stats.ships_left,
+        settings.ship_speed, settings.bullet_speed, settings.alien_speed,
+        settings.fleet_direction, settings.alien_points,
+        ship.x, ship.moving_left, ship.moving_right,
+        list(zip(bullets.x[:bullets.count].tolist(), bullets.y[:bullets.count].tolist())),
+    )).encode())
+    digest.update(ai_game.aliens.x.tobytes())
+    digest.update(ai_game.aliens.y.tobytes())
+    digest.update(ai_game.aliens.alive.tobytes())
+    return HASH.unpack(digest.digest())[0]
+
+
+class InputRecorder:
+    """A class to write tick-stamped input and periodic state hashes to a file."""
+
+    def __init__(self, path, ai_game, checkpoint_every=600):
+        """Open path for writing and store the settings a replay has to match."""
+        self.file = open(path, 'wb')
+        self.checkpoint_every = checkpoint_every
+        settings = ai_game.settings
+        self.file.write(HEADER.pack(MAGIC, VERSION, ai_game.state.skip_delays, settings.tick_rate,
+                                    settings.screen_width, settings.screen_height,
+                                    ai_game.assets.scale))   # the scale in use; fullscreen picks its own
+
+    def record(self, tick, action):
+        """Write one input action taken before tick runs."""
+        self.file.write(RECORD.pack(tick, action))
+
+    def on_tick(self, ai_game):
+        """Write a checkpoint hash every checkpoint_every ticks."""
+        if ai_game.ticks % self.checkpoint_every == 0:
+            self._write_hash(CHECKPOINT, ai_game)
+
+    def close(self, ai_game):
+        """Write the final tick and state hash, and close the file."""
+        self._write_hash(END, ai_game)
+        self.file.close()
+
+    def _write_hash(self, code, ai_game):
+        """Write a record carrying the current state hash."""
+        self.file.write(RECORD.pack(ai_game.ticks, code) + HASH.pack(state_hash(ai_game)))
+
+
+class InputReplayer:
+    """A class to feed a recorded session back into a game and check its state hashes."""
+
+    def __init__(self, path):
+        """Read a recording into per-tick actions and checkpoints."""
+        with open(path, 'rb') as file:
+            data = file.read()
+
+        magic, version = HEADER_V1.unpack_from(data)[:2]
+        if magic != MAGIC or version not in (1, VERSION):
+            raise ValueError(f"{path} is not a version 1 or {VERSION} Alien Invasion recording")
+        header = HEADER if version == VERSION else HEADER_V1
+        _, _, skip_delays, tick_rate, width, height, *scale = header.unpack_from(data)
+        self.skip_delays = bool(skip_delays)
+        self.tick_rate = tick_rate
+        self.screen_size = (width, height)
+        self.sprite_scale = scale[0] if scale else 1.0
+
+        self.actions_by_tick = {}   # tick -> list of actions to apply before that tick
+        self.checkpoints = {}   # tick -> expected state hash
+        self.end_tick = 0
+        self.end_hash = None
+        offset = header.size
+        while offset < len(data):
+            if offset + RECORD.size > len(data):
+                raise ValueError(f"{path} is an incomplete recording: it ends partway through a record")
+            tick, code = RECORD.unpack_from(data, offset)
+            offset += RECORD.size
+            if code in (CHECKPOINT, END):
+                if offset + HASH.size > len(data):
+                    raise ValueError(f"{path} is an incomplete recording: it ends partway through a record")
+                expected = HASH.unpack_from(data, offset)[0]
+                offset += HASH.size
+                if code == END:
+                    self.end_tick, self.end_hash = tick, expected
+                else:
+                    self.checkpoints[tick] = expected
+            else:
+                self.actions_by_tick.setdefault(tick, []).append(code)
+        if self.end_hash is None:
+            # The game stopped without closing the recording, so there's no final state to check.
+            raise ValueError(f"{path} is an incomplete recording: it has no end record")
+
+        self.verified = 0       # checkpoints that matched
+        self.mismatches = []    # ticks whose state hash didn't match
+
+    def configure(self, settings):
+        """Make settings match the ones the session was recorded with."""
+        settings.tick_rate = self.tick_rate
+        settings.screen_width, settings.screen_height = self.screen_size
+        settings.sprite_scale = self.sprite_scale   # sprite size decides the formation and collisions
+
+    def record(self, tick, action):
+        """Ignore actions; a replay doesn't record itself."""
+
+    def actions(self, ai_game):
+        """Return the actions recorded for the tick about to run; the replay is the game's input source."""
+        return self.actions_by_tick.get(ai_game.ticks, ())
+
+    def on_tick(self, ai_game):
+        """Check this tick's checkpoint, once its actions have been applied."""
+        if ai_game.ticks in self.checkpoints:
+            self._check(ai_game, self.checkpoints[ai_game.ticks])
+
+    def run(self, ai_game):
+        """Replay the whole session on ai_game as fast as possible."""
+        ai_game.state.skip_delays = self.skip_delays
+        ai_game.input_source = self
+        ai_game.input_log = self
+        while ai_game.ticks < self.end_tick:
+            ai_game._update_game()
+        # Input read after the last tick ran, e.g. on the frame that quit, still changed the end state.
+        for action in self.actions(ai_game):
+            ai_game._handle_action(action)
+        self._check(ai_game, self.end_hash)
+        return not self.mismatches
+
+    def close(self, ai_game):
+        """Nothing to flush for a replay."""
+
+    def _check(self, ai_game, expected):
+        """Compare the current state hash with the recorded one."""
+        if state_hash(ai_game) == expected:
+            self.verified += 1
+        else:
+            self.mismatches.append(ai_game.ticks)
@@ -0,0 +1,82 @@
+import pygame
+
+
+class Renderer:
+    """A class to draw frames, pushing only the screen regions that changed."""
+
+    def __init__(self, ai_game):
+        """Initialize the background and the dirty-rect bookkeeping."""
+        self.screen = ai_game.screen
+        self.screen_rect = self.screen.get_rect()
+        self.settings = ai_game.settings
+        self.full_redraw = self.settings.full_redraw
+
+        # A plain background to erase old sprite positions with; made on the first frame,
+        # so games that never draw don't pay for a screen-sized surface
+        self.background = None
+
+        self._last_rects = []   # regions drawn last frame; erased at the start of this one
+        self._frame_rects = []  # regions drawn so far this frame
+        self._needs_flip = True     # the whole screen must be pushed once before dirty updates
+
+        # Bandwidth statistics
+        self.pixels_pushed = 0      # pixels sent to the display on the last frame
+        self.total_pixels_pushed = 0
+        self.frames = 0
+
+    def set_background(self, color):
+        """Change the background color; the next frame redraws the whole screen with it."""
+        if self.background is None:
+            self.background = pygame.Surface(self.screen_rect.size).convert(self.screen)
+        self.background.fill(color)
+        self._needs_flip = True
+
+    def redraw_all(self):
+        """Push the whole screen on the next frame, e.g. after the window was uncovered."""
+        self._needs_flip = True
+
+    def set_full_redraw(self, full_redraw):
+        """Switch between full-screen redraws and dirty-rect updates."""
+        self.full_redraw = full_redraw
+        self._needs_flip = True
+
+    def begin_frame(self):
+        """Erase the previous frame, either entirely or only where sprites were."""
+        if self.background is None:
+            self.set_background(self.settings.bg_color)
+        if self.full_redraw or self._needs_flip:
+            self.screen.blit(self.background, (0, 0))
+        else:
+            for rect in self._last_rects:
+                self.screen.blit(self.background, rect, rect)
+        self._frame_rects = []
+
+    def add(self, rects):
+        """Record a drawn Rect, or a list of them, as changed this frame."""
+        if isinstance(rects, pygame.Rect):
+            self._frame_rects.append(rects)
+        else:
+            self._frame_rects.extend(rects)
+
+    def end_frame(self):
+        """Push this frame's changes to the display."""
+        if self.full_redraw or self._needs_flip:
+            pygame.display.flip()
+            self.pixels_pushed = self.screen_rect.width * self.screen_rect.height
+            self._needs_flip = False
+        else:
+            # Old positions must be pushed too, so the erased background shows up.
+            dirty = self._last_rects + self._frame_rects
+            pygame.display.update(dirty)
+            self.pixels_pushed = 0
+            for rect in dirty:
+                visible = rect.clip(self.screen_rect)
+                self.pixels_pushed += visible.width * visible.height
+
+        self._last_rects = self._frame_rects
+        self.total_pixels_pushed += self.pixels_pushed
+        self.frames += 1
+
+    def average_pixels_pushed(self):
+        """Return the mean number of pixels pushed per frame so far."""
+        return self.total_pixels_pushed / self.frames if self.frames else 0
@@ -0,0 +1,39 @@
+import argparse
+import sys
+import time
+
+from profiles import add_profile_argument, load_settings
+from alien_invasion import AlienInvasion
+from recording import InputReplayer
+
+
+def main():
+    """Replay a recorded session headless and check that it ends in the same state."""
+    parser = argparse.ArgumentParser(description="Replay a recorded Alien Invasion session.")
+    parser.add_argument('recording', help="file written by alien_invasion.py --record")
+    add_profile_argument(parser)    # must be the profile the session was recorded with
+    args = parser.parse_args()
+
+    try:
+        replayer = InputReplayer(args.recording)
+    except (OSError, ValueError) as error:
+        print(f"can't replay: {error}", file=sys.stderr)
+        sys.exit(2)
+    settings = load_settings(args.profile)
+    replayer.configure(settings)
+    ai = AlienInvasion(settings=settings, headless=True)
+
+    start = time.perf_counter()
+    matched = replayer.run(ai)
+    elapsed = time.perf_counter() - start
+
+    print(f"{ai.ticks} ticks in {elapsed:.2f}s ({ai.ticks / max(elapsed, 1e-9):,.0f} ticks/s)")
+    print(f"score {ai.stats.score:,}  level {ai.stats.level}  ships left {ai.stats.ships_left}")
+    print(f"{replayer.verified} state hashes matched, {len(replayer.mismatches)} did not")
+    if not matched:
+        print(f"first mismatch at tick {replayer.mismatches[0]}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
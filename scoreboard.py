@@ -1,10 +1,8 @@
-import pygame.font
-from pygame.sprite import Group
-from ship import Ship
+import pygame
 
 
 class Scoreboard:
-    """A class to report scoring information"""
+    """A class to report scoring information, drawn as one cached HUD image"""
 
     def __init__(self, ai_game):
         """Initialize scorekeeping attributes."""
@@ -13,10 +11,20 @@ class Scoreboard:
         self.screen_rect = self.screen.get_rect()
         self.settings = ai_game.settings
         self.stats = ai_game.stats
+        self.text_cache = ai_game.text_cache
 
         # Font settings for scoring information
         self.text_color = (30, 30, 30)
-        self.font = pygame.font.SysFont(None, 48)
+        self.font = self.text_cache.font(48)     # shared with the Play button
+        self.ship_image = ai_game.assets.get('ship')    # one small ship per life left
+
+        # Everything below is composited into one image, rebuilt only after a prep_*() call changes it
+        self.image = None
+        self.content_rects = []     # parts of the HUD that aren't transparent
+        self.invalidations = 0      # prep_*() calls that changed what the HUD shows
+        self.renders = 0            # times the HUD image was rebuilt; invalidations between frames share one
+        self.frames = 0             # times the HUD was drawn
+        self._dirty = True
 
         # Prepare the initial score image.
         self.prep_score()
@@ -29,52 +37,88 @@ class Scoreboard:
         rounded_score = round(self.stats.score, -1)    # round score value to the nearest 10, 100, 1000, and so on.
         score_str = "{:,}".format(rounded_score)       # insert commas into rounded score; ex: 10,000,000
         # Create an image from the string
-        self.score_image = self.font.render(score_str, True, self.text_color, self.settings.bg_color)
+        self.score_image = self.text_cache.render(self.font, score_str, self.text_color, self.settings.bg_color)
 
         # Display the score at the top right of the screen.
         self.score_rect = self.score_image.get_rect()
         self.score_rect.right = self.screen_rect.right - 20   # right edge 20 pixels from the right edge of screen
         self.score_rect.top = 20    # 20 pixels down from the top of the screen
+        self._invalidate()
 
     def prep_high_score(self):
         """Turn the high school into a rendered image."""
         high_score = round(self.stats.high_score, -1)   # round high score to the nearest 10, 100, etc.
         high_score_str = "{:,}".format(high_score)     # format high_score with the commas in between
         # generate an image from the high score
-        self.high_score_image = self.font.render(high_score_str, True, self.text_color, self.settings.bg_color)
+        self.high_score_image = self.text_cache.render(self.font, high_score_str, self.text_color,
+                                                      self.settings.bg_color)
 
         # Center the high score at the top of the screen.
         self.high_score_rect = self.high_score_image.get_rect()
         self.high_score_rect.centerx = self.screen_rect.centerx  # center high score rect horizontally
         self.high_score_rect.top = self.score_rect.top   # top attribute matches the top of the score image
+        self._invalidate()
 
     def prep_level(self):
         """Turn the level into a rendered image."""
         level_str = str(self.stats.level)
         # create an image from the value stored in stats.level
-        self.level_image = self.font.render(level_str, True, self.text_color, self.settings.bg_color)
+        self.level_image = self.text_cache.render(self.font, level_str, self.text_color, self.settings.bg_color)
 
         # Position the level below the score.
         self.level_rect = self.level_image.get_rect()
         # set image's right attribute to match the score's right attribute
         self.level_rect.right = self.score_rect.right
         self.level_rect.top = self.score_rect.bottom + 10   # space between the score and the level
+        self._invalidate()
 
     def prep_ships(self):
         """Show how many ships are left."""
-        self.ships = Group()    # empty group to hold the ship instances
+        self.ship_rects = []
         for ship_number in range(self.stats.ships_left):    # every ship the player has left
-            ship = Ship(self.ai_game)
-            ship.rect.x = 10 + ship_number * ship.rect.width    # 10-pixel margin between ships
-            ship.rect.y = 10    # 10 pixels down from the top of the screen, upper-left corner of the screen
-            self.ships.add(ship)    # add each new ship to the group ships
+            rect = self.ship_image.get_rect()
+            rect.x = 10 + ship_number * rect.width    # 10-pixel margin between ships
+            rect.y = 10    # 10 pixels down from the top of the screen, upper-left corner of the screen
+            self.ship_rects.append(rect)
+        self._invalidate()
 
     def show_score(self):
-        """Draw score to the screen."""
-        self.screen.blit(self.score_image, self.score_rect)     # draw current score at top right
-        self.screen.blit(self.high_score_image, self.high_score_rect)   # high score at the top center
-        self.screen.blit(self.level_image, self.level_rect)     # draw level image to the screen
-        self.ships.draw(self.screen)        # draw each ship to the screen
+        """Draw the HUD to the screen in one blit and return the Rects that were drawn."""
+        if self._dirty:
+            self._render()
+        self.frames += 1
+        self.screen.blit(self.image, (0, 0))
+        # The rest of the image is transparent, so only these parts of the screen changed
+        return self.content_rects
+
+    def report(self):
+        """Return a dict of HUD invalidations, renders and frames drawn."""
+        return {'invalidations': self.invalidations, 'renders': self.renders, 'frames': self.frames}
+
+    def _invalidate(self):
+        """Note that the HUD image is out of date; it is rebuilt the next time it is drawn."""
+        self.invalidations += 1
+        self._dirty = True
+
+    def _render(self):
+        """Composite the score, high score, level and ships into the HUD image."""
+        items = [
+            (self.score_image, self.score_rect),    # current score at top right
+            (self.high_score_image, self.high_score_rect),  # high score at the top center
+            (self.level_image, self.level_rect),    # level below the score
+        ] + [(self.ship_image, rect) for rect in self.ship_rects]
+        self.content_rects = [rect.copy() for _, rect in items]
+
+        # A strip across the top of the screen, as tall as its lowest item
+        size = (self.screen_rect.width, max(rect.bottom for rect in self.content_rects))
+        if self.image is None or self.image.get_size() != size:
+            self.image = pygame.Surface(size).convert(self.screen)
+        # Background pixels are transparent, and run-length encoding lets the blit skip them quickly
+        self.image.fill(self.settings.bg_color)
+        self.image.set_colorkey(self.settings.bg_color, pygame.RLEACCEL)
+        self.image.blits(items, doreturn=False)
+        self.renders += 1
+        self._dirty = False
 
     def check_high_score(self):
         """Check to see if there's a new high score."""
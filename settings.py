@@ -7,9 +7,25 @@ class Settings:
         self.screen_width = 1200
         self.screen_height = 800
         self.bg_color = (230, 230, 230)
+        self.full_redraw = False    # True redraws and flips the whole screen every frame
+        self.fullscreen = False     # True fills the monitor at its native resolution instead of a window
+        self.sprite_scale = 0.0     # image size multiplier; 0 means 1 in a window, screen height / 800 in fullscreen
+
+        # Loop pacing settings; all speeds below are pixels per simulation tick
+        self.tick_rate = 120    # fixed simulation ticks per second
+        self.max_fps = 60       # cap on rendered frames per second
+        self.max_ticks_per_frame = 5    # catch-up limit when rendering falls behind
 
         # Ship settings
         self.ship_limit = 3  # number of ships the player starts with
+        self.respawn_pause = 0.5    # seconds the game holds still after the ship is hit
+        self.level_pause = 0.5      # seconds between clearing a fleet and the next one arriving
+
+        # High score settings
+        self.high_score_file = 'high_scores.json'
+        self.leaderboard_size = 10  # number of best games kept
+        self.snapshot_file = 'quicksave.snapshot'  # where F5 saves the game and F9 loads it from
+        self.profile_trace_file = 'profile_trace'   # F4 saves frame timings here, as .json and .csv
 
         # Bullet settings
         self.bullet_width = 3
@@ -19,6 +35,9 @@ class Settings:
 
         # Alien settings
         self.fleet_drop_speed = 10  # fleet drop speed
+        self.fleet_formation = 'grid'   # 'grid', 'staggered', 'wedge' or one registered with FleetLayouts
+        self.fleet_spawn_per_tick = 64  # aliens brought in per tick when a new wave arrives
+        self.collision_cell_size = 128  # side of a collision grid cell; at least one alien wide works best
 
         # How quickly the game speeds up
         self.speedup_scale = 1.1
@@ -26,19 +45,25 @@ class Settings:
         # How quickly the alien point values increase
         self.score_scale = 1.5
 
+        # Starting values of the settings that change throughout the game
+        self.initial_ship_speed = 1.5     # 1.5 pixels when moving
+        self.initial_bullet_speed = 3.0
+        self.initial_alien_speed = 1.0
+        self.initial_alien_points = 50
+
         self.initialize_dynamic_settings()  # Initialize the attributes that need to change throughout the game
 
     def initialize_dynamic_settings(self):
         """Initialize settings that change throughout the game."""
-        self.ship_speed = 1.5         # 1.5 pixels when moving
-        self.bullet_speed = 3.0
-        self.alien_speed = 1.0
+        self.ship_speed = self.initial_ship_speed
+        self.bullet_speed = self.initial_bullet_speed
+        self.alien_speed = self.initial_alien_speed
 
         # fleet_direction of 1 represents right; -1 represents left.
         self.fleet_direction = 1
 
         # Scoring
-        self.alien_points = 50
+        self.alien_points = self.initial_alien_points
 
     def increase_speed(self):
         """Increase speed settings."""
@@ -1,5 +1,3 @@
-import pygame
-
 from pygame.sprite import Sprite
 
 
@@ -13,14 +11,15 @@ class Ship(Sprite):
         self.screen_rect = ai_game.screen.get_rect()
         self.settings = ai_game.settings
 
-        # Load the ship image and get its rect.
-        self.image = pygame.image.load('images/ship.bmp')
+        # Use the shared ship image and get its rect.
+        self.image = ai_game.assets.get('ship')
         self.rect = self.image.get_rect()
         # start each new ship at the bottom center of the screen.
         self.rect.midbottom = self.screen_rect.midbottom
 
         # Store a decimal value for the ship's horizontal position
         self.x = float(self.rect.x)
+        self.prev_x = self.x    # position at the previous tick, for interpolated drawing
 
         # Movement Flag
         self.moving_right = False
@@ -29,6 +28,7 @@ class Ship(Sprite):
     def update(self):
         """update the ship's position based on the movement flag."""
         # update the ship's x value, not the rect.
+        self.prev_x = self.x
         if self.moving_right and self.rect.right < self.screen_rect.right:
             self.x += self.settings.ship_speed
         if self.moving_left and self.rect.left >0:
@@ -37,11 +37,14 @@ class Ship(Sprite):
         # Update rect object from self.x.
         self.rect.x = self.x
 
-    def blitme(self):
-        """Draw the ship at its current location."""
-        self.screen.blit(self.image, self.rect)
+    def blitme(self, alpha=1.0):
+        """Draw the ship between its last two positions; alpha=1.0 is the current one."""
+        draw_rect = self.rect.copy()
+        draw_rect.x = self.prev_x + (self.x - self.prev_x) * alpha
+        return self.screen.blit(self.image, draw_rect)
 
     def center_ship(self):
         """Center the ship on the screen."""
         self.rect.midbottom = self.screen_rect.midbottom
         self.x = float(self.rect.x)
+        self.prev_x = self.x    # don't interpolate across the jump
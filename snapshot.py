@@ -0,0 +1,172 @@
+import copy
+import io
+import json
+
+import numpy as np
+import pygame
+
+from game_state import GameState
+
+
+VERSION = 1
+
+# Settings that change during a game; everything else comes from the game a snapshot is restored into.
+DYNAMIC_SETTINGS = ('ship_speed', 'bullet_speed', 'alien_speed', 'fleet_direction', 'alien_points')
+
+# Game methods a timed phase may call when it ends; a snapshot stores the name.
+CALLBACKS = ('_respawn', '_create_fleet')
+
+# Everything capture() stores, bar the sprite scale older snapshots lack; restore() checks
+# for all of it before changing the game.
+VALUES = ('screen_size', 'ticks', 'phase', 'ticks_left', 'on_done', 'game_active',
+          'score', 'level', 'ships_left', 'settings', 'ship', 'fleet')
+ARRAYS = ('alien_x', 'alien_y', 'alien_alive', 'bullet_x', 'bullet_y', 'bullet_prev_y')
+
+
+class Snapshot:
+    """A copy of everything a running game depends on, to restore, save or fork it later."""
+
+    def __init__(self, values, arrays):
+        """Initialize a snapshot from a dict of plain values and a dict of NumPy arrays."""
+        self.values = values
+        self.arrays = arrays
+
+    def to_bytes(self):
+        """Return the snapshot as bytes: a compressed .npz with the plain values stored as JSON."""
+        buffer = io.BytesIO()
+        header = np.frombuffer(json.dumps(self.values).encode(), dtype=np.uint8)
+        np.savez_compressed(buffer, header=header, **self.arrays)
+        return buffer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Return the snapshot stored in data by to_bytes()."""
+        try:
+            with np.load(io.BytesIO(data), allow_pickle=False) as archive:
+                values = json.loads(archive['header'].tobytes())
+                arrays = {name: archive[name] for name in archive.files if name != 'header'}
+        except (OSError, ValueError, KeyError) as error:
+            raise ValueError(f"not an Alien Invasion snapshot: {error}") from error
+        if values.get('version') != VERSION:
+            raise ValueError(f"not a version {VERSION} Alien Invasion snapshot")
+        return cls(values, arrays)
+
+    def save(self, path):
+        """Write the snapshot to path."""
+        with open(path, 'wb') as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        """Read a snapshot written by save()."""
+        with open(path, 'rb') as file:
+            return cls.from_bytes(file.read())
+
+
+def capture(ai_game):
+    """Return a Snapshot of ai_game's current state."""
+    stats, settings, ship, state = ai_game.stats, ai_game.settings, ai_game.ship, ai_game.state
+    aliens, bullets = ai_game.aliens, ai_game.bullets
+    on_done = state.on_done
+    values = {
+        'version': VERSION,
+        'screen_size': [settings.screen_width, settings.screen_height],
+        'sprite_scale': ai_game.assets.scale,
+        'ticks': ai_game.ticks,
+        'phase': state.phase,
+        'ticks_left': state.ticks_left,
+        'on_done': on_done.__name__ if on_done else None,
+        'game_active': stats.game_active,
+        'score': stats.score,
+        'level': stats.level,
+        'ships_left': stats.ships_left,
+        'settings': {name: getattr(settings, name) for name in DYNAMIC_SETTINGS},
+        'ship': [ship.x, ship.prev_x, ship.moving_left, ship.moving_right],
+        'fleet': [aliens.spawned, aliens.spawn_per_tick, aliens.last_dx],
+    }
+    arrays = {
+        'alien_x': aliens.x.copy(),
+        'alien_y': aliens.y.copy(),
+        'alien_alive': aliens.alive.copy(),
+        'bullet_x': bullets.x[:bullets.count].copy(),
+        'bullet_y': bullets.y[:bullets.count].copy(),
+        'bullet_prev_y': bullets.prev_y[:bullets.count].copy(),
+    }
+    return Snapshot(values, arrays)
+
+
+def restore(ai_game, snapshot):
+    """Put ai_game into the state saved in snapshot.
+
+    The game keeps its own static settings; only the screen size and sprite scale have to match.
+    The snapshot is checked in full first, so a ValueError leaves the game as it was.
+    """
+    values, arrays = snapshot.values, snapshot.arrays
+    missing = [name for name in VALUES if name not in values]
+    missing += [name for name in ARRAYS if name not in arrays]
+    missing += [f"settings.{name}" for name in DYNAMIC_SETTINGS if name not in values.get('settings', {})]
+    if missing:
+        raise ValueError(f"snapshot is missing {', '.join(missing)}")
+    if values['phase'] not in GameState.PHASES:
+        raise ValueError(f"unknown game phase {values['phase']!r}")
+    if not len(arrays['alien_x']) == len(arrays['alien_y']) == len(arrays['alien_alive']) or \
+            not len(arrays['bullet_x']) == len(arrays['bullet_y']) == len(arrays['bullet_prev_y']):
+        raise ValueError("snapshot arrays don't match in length")
+    if len(values['ship']) != 4 or len(values['fleet']) != 3:
+        raise ValueError("snapshot ship or fleet values are malformed")
+
+    settings = ai_game.settings
+    if values['screen_size'] != [settings.screen_width, settings.screen_height]:
+        raise ValueError(f"snapshot is for a {values['screen_size'][0]}x{values['screen_size'][1]} screen, "
+                         f"not {settings.screen_width}x{settings.screen_height}")
+    sprite_scale = values.get('sprite_scale', 1.0)  # older snapshots were all taken at 1
+    if sprite_scale != ai_game.assets.scale:
+        raise ValueError(f"snapshot is for sprites at scale {sprite_scale:g}, not {ai_game.assets.scale:g}")
+    if values['on_done'] not in CALLBACKS + (None,):
+        raise ValueError(f"unknown phase callback {values['on_done']!r}")
+
+    ai_game.ticks = values['ticks']
+    ai_game.state.resume(values['phase'], values['ticks_left'],
+                         getattr(ai_game, values['on_done']) if values['on_done'] else None)
+
+    stats = ai_game.stats
+    stats.game_active = values['game_active']
+    stats.score = values['score']
+    stats.level = values['level']
+    stats.ships_left = values['ships_left']
+    for name, value in values['settings'].items():
+        setattr(settings, name, value)
+
+    ship = ai_game.ship
+    ship.x, ship.prev_x, ship.moving_left, ship.moving_right = values['ship']
+    ship.rect.x = ship.x
+
+    # Rebuild the fleet and bullets from whole arrays rather than one object at a time.
+    spawned, spawn_per_tick, last_dx = values['fleet']
+    ai_game.aliens.restore(arrays['alien_x'], arrays['alien_y'], arrays['alien_alive'],
+                           spawned, spawn_per_tick, last_dx)
+    ai_game.bullets.restore(arrays['bullet_x'], arrays['bullet_y'], arrays['bullet_prev_y'])
+
+    scoreboard = ai_game.scoreboard
+    scoreboard.prep_score()
+    scoreboard.prep_level()
+    scoreboard.prep_ships()
+    scoreboard.check_high_score()
+    pygame.mouse.set_visible(not stats.game_active)
+
+
+def fork(ai_game, target=None):
+    """Return a separate game in the same state as ai_game, for what-if runs and searches.
+
+    The copy is restored into target if given; otherwise into a new headless game with a
+    copy of ai_game's settings and its sprite scale. A new game shares pygame's display, so
+    fork headless games.
+    """
+    snapshot = capture(ai_game)
+    if target is None:
+        from alien_invasion import AlienInvasion   # imported here; alien_invasion imports this module
+        settings = copy.copy(ai_game.settings)
+        settings.sprite_scale = ai_game.assets.scale    # a fullscreen game's scale isn't in its settings
+        target = AlienInvasion(settings=settings, headless=True)
+    restore(target, snapshot)
+    return target
@@ -0,0 +1,15 @@
+import os
+import sys
+
+import pytest
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')   # no window, even for games that aren't headless
+
+
+@pytest.fixture(autouse=True)
+def in_repo(monkeypatch):
+    """Run every test from the repository root, where the game finds its images."""
+    monkeypatch.chdir(ROOT)
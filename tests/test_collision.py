@@ -0,0 +1,54 @@
+import pygame
+
+from alien_invasion import AlienInvasion
+from collision import SpatialHash, rect_round
+
+
+def test_spatial_hash_insert_and_query():
+    grid = SpatialHash(100)
+    grid.insert('a', 10, 10, 20, 20)
+    grid.insert('b', 90, 10, 20, 20)     # straddles two columns
+    assert grid.query(pygame.Rect(0, 0, 50, 50)) == {'a', 'b'}
+    assert grid.query(pygame.Rect(150, 0, 10, 10)) == {'b'}
+    assert grid.query(pygame.Rect(0, 150, 10, 10)) == set()
+
+
+def test_spatial_hash_remove_and_clear():
+    grid = SpatialHash(100)
+    grid.insert('a', 10, 10, 20, 20)
+    grid.insert('b', 150, 10, 20, 20)
+    grid.remove('a')
+    assert grid.query(pygame.Rect(0, 0, 300, 50)) == {'b'}
+    assert (0, 0) not in grid.cells     # empty cells are dropped
+    grid.clear()
+    assert not grid.cells and not grid.bounds
+
+
+def test_rect_round_matches_pygame():
+    values = [2.5, 3.5, -2.5, -0.5, 0.49999999999999994, 1.2, -1.7, 0.0]
+    rect = pygame.Rect(0, 0, 1, 1)
+    expected = []
+    for value in values:
+        rect.x = value
+        expected.append(rect.x)
+    assert rect_round(values).tolist() == expected
+
+
+def test_fleet_candidates_cover_every_overlap_as_the_fleet_moves():
+    ai = AlienInvasion(headless=True)
+    ai._start_game()
+    fleet = ai.aliens
+    while fleet.spawned < len(fleet.x):
+        fleet.update()
+    fleet.kill([0, 5])
+    overlaps = 0
+    for step in range(300):
+        fleet.update()
+        if step % 50 == 0:
+            fleet.drop(10)
+        probe = pygame.Rect(step * 4 % ai.settings.screen_width, step % 200, 3, 15)
+        overlapping = {index for index in range(len(fleet.x))
+                       if fleet.alive[index] and probe.colliderect(fleet.alien_rect(index))}
+        assert overlapping <= fleet.candidates(probe)
+        overlaps += len(overlapping)
+    assert overlaps     # the probes did reach the fleet
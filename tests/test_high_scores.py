@@ -0,0 +1,55 @@
+import json
+
+from high_scores import HighScoreStore
+
+
+def test_submits_are_saved_and_coalesced(tmp_path):
+    path = tmp_path / 'high_scores.json'
+    store = HighScoreStore(str(path), size=3)
+    scores = [500, 100, 900, 300, 700]
+    for score in scores:
+        store.submit(score, 1)
+    store.close()
+    assert store._writer is None    # close() joined the writer thread
+
+    saved = json.loads(path.read_text())
+    assert [entry['score'] for entry in saved] == [900, 700, 500]
+    assert 1 <= store.writes <= store.submitted <= len(scores)
+    assert [file.name for file in tmp_path.iterdir()] == ['high_scores.json']  # no temp files left
+
+
+def test_reload_and_submit_before_load(tmp_path):
+    path = tmp_path / 'high_scores.json'
+    path.write_text(json.dumps([{'score': 800, 'level': 2, 'time': ''}]))
+    store = HighScoreStore(str(path))
+    assert not store.loaded
+    store.submit(200, 1)    # must not save over the unread score
+    store.close()
+    assert [entry['score'] for entry in json.loads(path.read_text())] == [800, 200]
+
+    store = HighScoreStore(str(path))
+    assert store.best() == 800
+    store.close()
+
+
+def test_low_scores_and_memory_only(tmp_path):
+    store = HighScoreStore(None, size=2)
+    assert store.submit(10, 1) and store.submit(20, 1)
+    assert not store.submit(5, 1)   # doesn't beat the last place
+    assert not store.submit(0, 1)
+    assert store.best() == 20
+    store.close()
+
+
+def test_unreadable_files_load_empty(tmp_path):
+    path = tmp_path / 'high_scores.json'
+    for text in ('{not json', '[1]', '{"score": 5}', '"text"'):
+        path.write_text(text)
+        store = HighScoreStore(str(path))
+        assert store.best() == 0 and store.entries == []
+        store.close()
+    path.write_text(json.dumps([{'score': 'lots'}, {'score': 40, 'level': 1}, None]))
+    store = HighScoreStore(str(path))
+    assert store.best() == 40
+    assert store.entries == [{'score': 40, 'level': 1}]
+    store.close()
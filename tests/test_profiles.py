@@ -0,0 +1,65 @@
+import json
+import os
+
+import pytest
+
+from profiles import PROFILE_DIR, ProfileError, find_profile, load_settings, read_profile, validate
+
+
+def test_validate_normalizes_numbers_and_colors():
+    values = validate({'initial_alien_speed': 2, 'bg_color': [10, 20, 30], 'fleet_formation': 'wedge'})
+    assert values == {'initial_alien_speed': 2.0, 'bg_color': (10, 20, 30), 'fleet_formation': 'wedge'}
+    assert isinstance(values['initial_alien_speed'], float)
+
+
+@pytest.mark.parametrize('values', [
+    {'no_such_setting': 1},
+    {'bullets_allowed': 2.5},           # int setting
+    {'full_redraw': 1},                 # bool setting
+    {'bullet_color': [0, 0, 256]},
+    {'bullet_speed': 3.0},              # derived; profiles set initial_bullet_speed
+    {'tick_rate': 0},
+    {'fleet_drop_speed': -1},
+    {'fleet_formation': 'diamond'},
+])
+def test_validate_rejects(values):
+    with pytest.raises(ProfileError):
+        validate(values)
+
+
+def test_validate_reports_every_problem():
+    with pytest.raises(ProfileError) as error:
+        validate({'tick_rate': 0, 'fleet_formation': 'diamond'}, 'test')
+    assert 'tick_rate' in str(error.value) and 'fleet_formation' in str(error.value)
+
+
+def test_validate_accepts_extra_formations():
+    choices = {'fleet_formation': {'diamond': None}}
+    assert validate({'fleet_formation': 'diamond'}, choices=choices) == {'fleet_formation': 'diamond'}
+
+
+@pytest.mark.parametrize('name', sorted(os.path.splitext(file)[0] for file in os.listdir(PROFILE_DIR)))
+def test_shipped_profiles_load(name):
+    settings = load_settings(name)
+    for setting, value in read_profile(find_profile(name)).items():
+        assert getattr(settings, setting) == value
+
+
+def test_read_profile_json_and_toml(tmp_path):
+    json_path = tmp_path / 'fast.json'
+    json_path.write_text(json.dumps({'initial_ship_speed': 3}))
+    toml_path = tmp_path / 'fast.toml'
+    toml_path.write_text('initial_ship_speed = 3\n')
+    assert read_profile(str(json_path)) == read_profile(str(toml_path)) == {'initial_ship_speed': 3.0}
+
+
+def test_read_profile_bad_files(tmp_path):
+    broken = tmp_path / 'broken.toml'
+    broken.write_text('initial_ship_speed = \n')
+    not_a_table = tmp_path / 'list.json'
+    not_a_table.write_text('[1]')
+    for path in (broken, not_a_table, tmp_path / 'missing.json'):
+        with pytest.raises(ProfileError):
+            read_profile(str(path))
+    with pytest.raises(ProfileError):
+        find_profile('no such profile')
@@ -0,0 +1,88 @@
+import struct
+
+import pytest
+
+from actions import Action
+from alien_invasion import AlienInvasion
+from headless import RandomPolicy
+from recording import CHECKPOINT, END, HASH, HEADER, RECORD, InputRecorder, InputReplayer
+from settings import Settings
+
+
+def record_session(path, ticks=1500, settings=None):
+    """Play a short bot-driven session with a recorder attached and return the game."""
+    ai = AlienInvasion(settings=settings, headless=True)
+    ai.input_log = InputRecorder(path, ai, checkpoint_every=100)
+    ai.input_source = RandomPolicy(7)
+    ai._handle_action(Action.PLAY)
+    while ai.ticks < ticks and ai.stats.game_active:
+        ai._update_game()
+    ai._handle_action(Action.FIRE)  # input after the last tick, as on the frame that quits
+    ai.input_log.close(ai)
+    return ai
+
+
+def replay(path):
+    """Replay a recording into a fresh headless game and return the replayer."""
+    replayer = InputReplayer(path)
+    settings = Settings()
+    replayer.configure(settings)
+    replayer.run(AlienInvasion(settings=settings, headless=True))
+    return replayer
+
+
+def test_replay_matches_every_checkpoint(tmp_path):
+    path = str(tmp_path / 'session.airp')
+    ai = record_session(path)
+    replayer = replay(path)
+    assert replayer.mismatches == []
+    assert replayer.verified == len(replayer.checkpoints) + 1  # and the end hash
+    assert replayer.end_tick == ai.ticks
+
+
+def test_replay_reports_a_changed_input(tmp_path):
+    path = tmp_path / 'session.airp'
+    record_session(str(path))
+    data = bytearray(path.read_bytes())
+    # Turn the first fire into a move, so the game goes differently from there on.
+    offset = HEADER.size
+    while True:
+        tick, code = RECORD.unpack_from(data, offset)
+        if code == Action.FIRE:
+            struct.pack_into(RECORD.format, data, offset, tick, Action.MOVE_LEFT)
+            break
+        offset += RECORD.size + (HASH.size if code in (CHECKPOINT, END) else 0)
+    path.write_bytes(bytes(data))
+    assert replay(str(path)).mismatches
+
+
+def test_replay_uses_the_recorded_sprite_scale(tmp_path):
+    path = str(tmp_path / 'session.airp')
+    settings = Settings()
+    settings.sprite_scale = 1.35
+    record_session(path, settings=settings)
+    replayer = replay(path)
+    assert replayer.sprite_scale == 1.35
+    assert replayer.mismatches == []
+
+
+def test_truncated_recordings_are_refused(tmp_path):
+    path = tmp_path / 'session.airp'
+    record_session(str(path), ticks=300)
+    data = path.read_bytes()
+    for cut in (RECORD.size + HASH.size, 5):    # the whole end record, or part of it
+        path.write_bytes(data[:-cut])
+        with pytest.raises(ValueError, match='incomplete'):
+            InputReplayer(str(path))
+
+
+def test_shut_down_ends_the_recording(tmp_path):
+    path = str(tmp_path / 'session.airp')
+    ai = AlienInvasion(headless=True)
+    ai.input_log = InputRecorder(path, ai, checkpoint_every=100)
+    ai._handle_action(Action.PLAY)
+    for _ in range(250):
+        ai._update_game()
+    ai._shut_down()     # what main() does when the game crashes
+    ai._shut_down()
+    assert replay(path).mismatches == []
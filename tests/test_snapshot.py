@@ -0,0 +1,83 @@
+import pytest
+
+from actions import Action
+from alien_invasion import AlienInvasion
+from headless import RandomPolicy
+from recording import state_hash
+from settings import Settings
+from snapshot import Snapshot, capture, fork, restore
+
+
+def play(ai, ticks, seed):
+    """Run ticks of a bot-driven game and return the state hash after each one."""
+    ai.input_source = RandomPolicy(seed)
+    if not ai.stats.game_active:
+        ai._handle_action(Action.PLAY)
+    hashes = []
+    for _ in range(ticks):
+        ai._update_game()
+        hashes.append(state_hash(ai))
+    return hashes
+
+
+def test_restore_reproduces_the_state_hash():
+    ai = AlienInvasion(headless=True)
+    play(ai, 700, seed=3)
+    target = AlienInvasion(settings=Settings(), headless=True)
+    restore(target, Snapshot.from_bytes(capture(ai).to_bytes()))
+    assert state_hash(target) == state_hash(ai)
+
+
+def test_restored_game_plays_on_identically():
+    ai = AlienInvasion(headless=True)
+    play(ai, 700, seed=3)
+    copy = fork(ai)
+    assert play(copy, 500, seed=9) == play(ai, 500, seed=9)
+
+
+def test_save_and_load(tmp_path):
+    ai = AlienInvasion(headless=True)
+    play(ai, 300, seed=1)
+    path = str(tmp_path / 'game.snapshot')
+    capture(ai).save(path)
+    target = AlienInvasion(settings=Settings(), headless=True)
+    restore(target, Snapshot.load(path))
+    assert state_hash(target) == state_hash(ai)
+
+
+def test_rejects_bad_data_and_mismatched_games():
+    with pytest.raises(ValueError):
+        Snapshot.from_bytes(b'not a snapshot')
+
+    ai = AlienInvasion(headless=True)
+    play(ai, 100, seed=1)
+    snapshot = capture(ai)
+    wide = Settings()
+    wide.screen_width = 1600
+    with pytest.raises(ValueError):
+        restore(AlienInvasion(settings=wide, headless=True), snapshot)
+    scaled = Settings()
+    scaled.sprite_scale = 1.5
+    with pytest.raises(ValueError):
+        restore(AlienInvasion(settings=scaled, headless=True), snapshot)
+
+
+@pytest.mark.parametrize('change', [
+    lambda snapshot: snapshot.arrays.pop('bullet_prev_y'),
+    lambda snapshot: snapshot.values.pop('ticks'),
+    lambda snapshot: snapshot.values['settings'].pop('alien_speed'),
+    lambda snapshot: snapshot.values.update(phase='paused'),
+    lambda snapshot: snapshot.values.update(on_done='_quit'),
+    lambda snapshot: snapshot.arrays.update(alien_y=snapshot.arrays['alien_y'][:-1]),
+])
+def test_bad_snapshot_leaves_the_game_alone(change):
+    ai = AlienInvasion(headless=True)
+    play(ai, 300, seed=2)
+    snapshot = Snapshot.from_bytes(capture(ai).to_bytes())
+    change(snapshot)
+    target = AlienInvasion(settings=Settings(), headless=True)
+    play(target, 50, seed=5)
+    before = state_hash(target)
+    with pytest.raises(ValueError):
+        restore(target, snapshot)
+    assert state_hash(target) == before
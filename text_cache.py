@@ -0,0 +1,87 @@
+from collections import OrderedDict
+
+import pygame
+
+
+class TextCache:
+    """A class to reuse rendered text instead of rasterizing it again."""
+
+    # Characters that make up formatted scores and levels.
+    glyph_chars = '0123456789,'
+
+    def __init__(self, max_strings=128):
+        """Initialize the glyph atlases, the string LRU and the counters."""
+        self.max_strings = max_strings
+        self._fonts = {}    # size -> the default font at that size, shared by everything drawing text
+        self._glyphs = {}   # (font, color, background) -> {char: surface}
+        self._strings = OrderedDict()   # (font, text, color, background) -> surface, oldest first
+
+        self.hits = 0       # renders answered from the LRU
+        self.misses = 0     # renders that had to build a surface
+        self.composed = 0   # misses built by blitting cached glyphs
+        self.rasterized = 0     # misses that needed font.render
+
+    def font(self, size):
+        """Return the shared default font at size, loading it on first use.
+
+        pygame's default font is bundled with pygame, so this skips the system font scan
+        that SysFont(None, size) starts with.
+        """
+        font = self._fonts.get(size)
+        if font is None:
+            font = self._fonts[size] = pygame.font.Font(None, size)
+        return font
+
+    def render(self, font, text, color, background):
+        """Return a surface of text, close to font.render(text, True, color, background).
+
+        Numbers and commas are composed from cached glyphs without kerning, so they can come
+        out a few pixels wider or narrower than font.render would draw them ("1,234,560" is
+        144 pixels wide rather than 148); other text is rendered by the font. The surface is
+        shared with other callers, so don't draw on it.
+        """
+        key = (font, text, color, background)
+        surface = self._strings.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._strings.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        if text and all(char in self.glyph_chars for char in text):
+            surface = self._compose(font, text, color, background)
+            self.composed += 1
+        else:
+            surface = font.render(text, True, color, background)
+            self.rasterized += 1
+
+        self._strings[key] = surface
+        if len(self._strings) > self.max_strings:
+            self._strings.popitem(last=False)   # drop the least recently used string
+        return surface
+
+    def report(self):
+        """Return the cache counters as a dict."""
+        return {'hits': self.hits, 'misses': self.misses,
+                'composed': self.composed, 'rasterized': self.rasterized}
+
+    def _compose(self, font, text, color, background):
+        """Build a surface for text by blitting pre-rendered glyphs side by side, with no kerning."""
+        glyphs = self._glyph_atlas(font, color, background)
+        images = [glyphs[char] for char in text]
+        surface = pygame.Surface((sum(image.get_width() for image in images), font.get_height()))
+        surface.fill(background)
+        x = 0
+        for image in images:
+            surface.blit(image, (x, 0))
+            x += image.get_width()
+        return surface
+
+    def _glyph_atlas(self, font, color, background):
+        """Return the glyph surfaces for one font and color pair, rendering them on first use."""
+        key = (font, color, background)
+        glyphs = self._glyphs.get(key)
+        if glyphs is None:
+            glyphs = {char: font.render(char, True, color, background) for char in self.glyph_chars}
+            self._glyphs[key] = glyphs
+        return glyphs
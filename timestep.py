@@ -0,0 +1,41 @@
+import pygame
+
+
+class FixedTimestep:
+    """A class to pace the main loop with fixed simulation ticks and a capped frame rate."""
+
+    def __init__(self, tick_rate, max_fps, max_ticks_per_frame):
+        """Initialize the pacing clock."""
+        self.tick_ms = 1000 / tick_rate     # length of one simulation tick in milliseconds
+        self.max_fps = max_fps              # 0 means render as fast as possible
+        self.max_ticks_per_frame = max_ticks_per_frame
+        self.clock = pygame.time.Clock()
+
+        self.accumulator = 0.0  # real time not yet consumed by simulation ticks
+        self.alpha = 0.0        # fraction of a tick between the last update and this frame
+
+        # Counters for checking how the loop keeps up
+        self.ticks = 0
+        self.frames = 0
+        self.dropped_ms = 0.0   # time thrown away because rendering fell too far behind
+
+    def advance(self):
+        """Wait for the next frame and return how many simulation ticks to run."""
+        self.accumulator += self.clock.tick(self.max_fps)  # sleeps to respect max_fps
+        steps = int(self.accumulator // self.tick_ms)
+        if steps > self.max_ticks_per_frame:
+            # Too far behind to catch up; drop the backlog rather than spiral.
+            self.dropped_ms += (steps - self.max_ticks_per_frame) * self.tick_ms
+            steps = self.max_ticks_per_frame
+            self.accumulator %= self.tick_ms
+        else:
+            self.accumulator -= steps * self.tick_ms
+
+        self.alpha = self.accumulator / self.tick_ms
+        self.ticks += steps
+        self.frames += 1
+        return steps
+
+    def get_fps(self):
+        """Return the measured rendered frames per second."""
+        return self.clock.get_fps()